@@ -6,8 +6,7 @@ from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
 from kivy.core.window import Window
 
-# Optional: nicer default window size on desktop (ignored on Android)
-Window.size = (360, 640)
+from calculator_engine import evaluate_expression, format_result, trailing_operator
 
 
 class CalculatorUI(BoxLayout):
@@ -159,8 +158,7 @@ class AndroidCalculator(BoxLayout):
         current = self.display.get_main()
 
         #trailing operator replacement
-        if current[-1] in "+-*/":
-            current = current[:-1]
+        current = current[:len(current) - len(trailing_operator(current))]
 
         self.display.set_main(current + op)
         self.display.set_history(current + op)
@@ -197,9 +195,9 @@ class AndroidCalculator(BoxLayout):
         expr = self.display.get_main()
 
         try:
-            result = eval(expr, {"__builtins__": None}, {})
+            result = evaluate_expression(expr)
             self.display.set_history(expr)
-            self.display.set_main(str(result))
+            self.display.set_main(format_result(result))
             self.just_evaluated = True
         except:
             self.display.set_main("Error")
@@ -221,6 +219,7 @@ class AndroidCalculator(BoxLayout):
 
 class AndroidCalculatorApp(App):
     def build(self):
+        Window.size = (360, 640)  # nicer default window size on desktop (ignored on Android)
         self.title = "Android Calculator"
         return AndroidCalculator()
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib
 import re
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
@@ -7,179 +8,26 @@ from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
+from kivy.uix.screenmanager import NoTransition, Screen, ScreenManager
+from kivy.uix.spinner import Spinner
 from kivy.core.window import Window
 from kivy.graphics import Color, RoundedRectangle
-from kivy.utils import get_color_from_hex
 
-# Optional: nicer default window size on desktop (ignored on Android)
-Window.size = (360, 640)
-Window.clearcolor = get_color_from_hex("#000000")  # iPhone-style black background
+from calculator_engine import VariableStore, format_result, trailing_operator
+from edit_history import EditLog
+from styles import BLACK, BUTTON_COLORS, SOFT_GRAY, WHITE
 
 
 # ---------------- I've updated the unary +/- and parentheis functions by using the Test Plan/Test cases ----------------
 # ---------------- You should now be able to utilize the negative/positive buttons in a expression as intended ----------------
-
-_NUM_RE = re.compile(
-    r"""
-    (?:
-        (?:\d+(?:\.\d*)?)   # 12 or 12. or 12.3
-      | (?:\.\d+)           # .5
-    )
-""",
-    re.VERBOSE,
-)
-
-
-def _tokenize(expr: str):
-    s = expr.replace(" ", "")
-    tokens = []
-    i = 0
-
-    def prev_allows_unary():
-        if not tokens:
-            return True
-        k, _ = tokens[-1]
-        return (k == "op") or (k == "lparen")
-
-    while i < len(s):
-        ch = s[i]
-
-        if ch == "(":
-            tokens.append(("lparen", ch))
-            i += 1
-            continue
-        if ch == ")":
-            tokens.append(("rparen", ch))
-            i += 1
-            continue
-
-        if ch == "%":  # postfix percent operator
-            tokens.append(("op", "%"))
-            i += 1
-            continue
-
-        if ch in "+-*/":
-            if ch in "+-" and prev_allows_unary():
-                tokens.append(("op", "u+" if ch == "+" else "u-"))
-            else:
-                tokens.append(("op", ch))
-            i += 1
-            continue
-
-        m = _NUM_RE.match(s, i)
-        if m:
-            tokens.append(("num", float(m.group(0))))
-            i = m.end()
-            continue
-
-        raise ValueError(f"Invalid character: {ch}")
-
-    return tokens
-
-
-def _to_rpn(tokens):
-    # precedence: % > unary +/- > * / > + -
-    prec = {"%": 4, "u+": 3, "u-": 3, "*": 2, "/": 2, "+": 1, "-": 1}
-    right_assoc = {"u+", "u-"}
-
-    output = []
-    stack = []
-
-    for kind, val in tokens:
-        if kind == "num":
-            output.append((kind, val))
-        elif kind == "op":
-            o1 = val
-            while stack and stack[-1][0] == "op":
-                o2 = stack[-1][1]
-                if ((o1 in right_assoc and prec[o1] < prec[o2]) or
-                        (o1 not in right_assoc and prec[o1] <= prec[o2])):
-                    output.append(stack.pop())
-                else:
-                    break
-            stack.append((kind, val))
-        elif kind == "lparen":
-            stack.append((kind, val))
-        elif kind == "rparen":
-            while stack and stack[-1][0] != "lparen":
-                output.append(stack.pop())
-            if not stack or stack[-1][0] != "lparen":
-                raise ValueError("Mismatched parentheses")
-            stack.pop()
-        else:
-            raise ValueError("Unknown token")
-
-    while stack:
-        if stack[-1][0] in ("lparen", "rparen"):
-            raise ValueError("Mismatched parentheses")
-        output.append(stack.pop())
-
-    return output
-
-
-def _eval_rpn(rpn):
-    st = []
-    for kind, val in rpn:
-        if kind == "num":
-            st.append(val)
-            continue
-
-        op = val
-
-        if op == "%":  # percent fix after test plan : x% = x/100
-            if not st:
-                raise ValueError("Missing operand for %")
-            x = st.pop()
-            st.append(x / 100.0)
-            continue
-
-        if op in ("u+", "u-"):  # The unary +/- buttons
-            if not st:
-                raise ValueError("Missing operand for unary")
-            x = st.pop()
-            st.append(+x if op == "u+" else -x)
-            continue
-
-        if len(st) < 2:
-            raise ValueError("Missing operand for binary")
-        b = st.pop()
-        a = st.pop()
-
-        if op == "+":
-            st.append(a + b)
-        elif op == "-":
-            st.append(a - b)
-        elif op == "*":
-            st.append(a * b)
-        elif op == "/":
-            if b == 0:
-                raise ZeroDivisionError("Division by zero")
-            st.append(a / b)
-        else:
-            raise ValueError("Unknown operator")
-
-    if len(st) != 1:
-        raise ValueError("Invalid expression")
-    return st[0]
-
-
-def evaluate_expression(expr: str) -> float:
-    return _eval_rpn(_to_rpn(_tokenize(expr)))
-
-
-def format_result(x: float) -> str:
-    if abs(x - round(x)) < 1e-10:
-        return str(int(round(x)))
-    s = f"{x:.12f}".rstrip("0").rstrip(".")
-    return s if s else "0"
+# ---------------- The tokenizer/RPN engine now lives in calculator_engine.py so every calculator screen shares it ----------------
 
 
 # ---------------- This is just a little extra for fun. I made the buttons appearance more like a mobile calculator you'd see ----------------
 
 class RoundButton(Button):
     
-    def __init__(self, **kwargs):
-        self.fill_color = kwargs.pop("fill_color", "#333333")
+    def __init__(self, kind="num", **kwargs):
         super().__init__(**kwargs)
 
         # Remove default button background so we can draw our own
@@ -188,11 +36,11 @@ class RoundButton(Button):
         self.background_color = (0, 0, 0, 0)
 
         # Text styling
-        self.color = get_color_from_hex("#FFFFFF")
+        self.color = WHITE
         self.bold = True
 
         with self.canvas.before:
-            self._c = Color(*get_color_from_hex(self.fill_color))
+            Color(*BUTTON_COLORS[kind])
             self._r = RoundedRectangle(radius=[999])  # This makes the buttons more of a bubble instead of square boxes
 
         self.bind(pos=self._update_shape, size=self._update_shape)
@@ -218,7 +66,7 @@ class CalculatorUI(BoxLayout):
             height=45,
         )
         self.history.bind(size=lambda inst, _: setattr(inst, "text_size", inst.size))
-        self.history.color = get_color_from_hex("#8E8E93")  # soft gray
+        self.history.color = SOFT_GRAY
 
         self.main = TextInput(
             text="0",
@@ -231,9 +79,9 @@ class CalculatorUI(BoxLayout):
             background_normal="",
             background_active="",
         )
-        self.main.foreground_color = get_color_from_hex("#FFFFFF")
-        self.main.background_color = get_color_from_hex("#000000")
-        self.main.cursor_color = get_color_from_hex("#000000")
+        self.main.foreground_color = WHITE
+        self.main.background_color = BLACK
+        self.main.cursor_color = BLACK
 
         self.add_widget(self.history)
         self.add_widget(self.main)
@@ -256,7 +104,7 @@ class AndroidCalculator(BoxLayout):
 
         # Draw a black background behind everything (matches iPhone vibe)
         with self.canvas.before:
-            Color(*get_color_from_hex("#000000"))
+            Color(*BLACK)
             self._bg = RoundedRectangle(pos=self.pos, size=self.size)
         self.bind(pos=self._update_bg, size=self._update_bg)
 
@@ -265,16 +113,48 @@ class AndroidCalculator(BoxLayout):
 
         self.just_evaluated = False
 
-        # Colors for button types
-        self._colors = {
-            "num": "#333333",   # numbers (dark gray)
-            "func": "#A5A5A5",  # AC / % / ± / ⌫ (light gray)
-            "op": "#FF9500",    # operators + equals (orange)
-        }
+        # Memory register (M+ / M- / MR / MC) and named variables (a=3*b)
+        self.memory = 0.0
+        self.variables = VariableStore()
+
+        # Undo / redo of display, history and memory (every key press is one step)
+        self.edits = EditLog(self._state())
 
         # AC / C button
         self.clear_btn = self._button("AC", self.clear, kind="func")
 
+        # ---- SCIENTIFIC ROWS (functions, constants, power, parentheses, memory, variables) ----
+        # Key label -> text that gets typed into the expression
+        self._sci_inserts = {
+            "√": "sqrt(", "sin": "sin(", "cos": "cos(", "tan": "tan(", "(": "(",
+            "log": "log(", "ln": "ln(", "exp": "exp(", "π": "pi", "e": "e", ")": ")",
+            "a": "a", "b": "b", "c": "c", "d": "d",
+        }
+        self._var_names = ("a", "b", "c", "d")
+        self.sci_grid = GridLayout(cols=7, spacing=10, size_hint_y=None, height=140)
+
+        self.edit_row = BoxLayout(orientation="horizontal", spacing=10, size_hint_y=None, height=40)
+        for b in (self._button("Undo", self.undo, "func"), self._button("Redo", self.redo, "func")):
+            b.font_size = 18
+            self.edit_row.add_widget(b)
+        self.add_widget(self.edit_row)
+
+        sci_buttons = [
+            self._sci_button("√"), self._sci_button("sin"), self._sci_button("cos"), self._sci_button("tan"),
+            self._sci_button("log"), self._sci_button("ln"), self._sci_button("exp"),
+
+            self._button("^", self.add_operator, "op"), self._sci_button("("), self._sci_button(")"),
+            self._sci_button("π"), self._sci_button("e"), self._sci_button("a"), self._sci_button("b"),
+
+            self._button("MC", self.memory_clear, "func"), self._button("MR", self.memory_recall, "func"),
+            self._button("M+", self.memory_add, "func"), self._button("M-", self.memory_add, "func"),
+            self._sci_button("c"), self._sci_button("d"), self._button("≔", self.assign, "op"),
+        ]
+        for b in sci_buttons:
+            b.font_size = 18
+            self.sci_grid.add_widget(b)
+        self.add_widget(self.sci_grid)
+
         # ---- MAIN KEYPAD LAYOUT ----
         self.keypad = BoxLayout(orientation="horizontal", spacing=10)
 
@@ -337,7 +217,8 @@ class AndroidCalculator(BoxLayout):
         Works for both the left grid and the right operator column.
         """
         # available space below the display
-        available_h = self.height - self.display.height - (self.padding[1] + self.padding[3]) - self.spacing
+        available_h = (self.height - self.display.height - self.edit_row.height - self.sci_grid.height
+                       - (self.padding[1] + self.padding[3]) - self.spacing * 3)
         available_h = max(available_h, 300)
 
         rows = 5
@@ -355,17 +236,42 @@ class AndroidCalculator(BoxLayout):
         btn = RoundButton(
             text=text,
             font_size=30 if text not in ("=", "AC") else 28,
-            fill_color=self._colors.get(kind, "#333333"),
+            kind=kind,
         )
-        btn.bind(on_press=handler)
+        btn.bind(on_press=lambda b: self._press(handler, b))
         return btn
 
+    def _press(self, handler, btn):
+        handler(btn)
+        self.edits.record(self._state())
+
+    def _sci_button(self, text):
+        return self._button(text, self.add_scientific, "func")
+
+    # ---------- Undo / Redo ----------
+    def _state(self):
+        return (self.display.get_main(), self.display.history.text, self.just_evaluated, self.memory)
+
+    def _restore(self, state):
+        main, history, self.just_evaluated, self.memory = state
+        self.display.set_main(main)
+        self.display.set_history(history)
+        self._update_clear_label()
+
+    def undo(self, _):
+        if self.edits.can_undo():
+            self._restore(self.edits.undo())
+
+    def redo(self, _):
+        if self.edits.can_redo():
+            self._restore(self.edits.redo())
+
     # ---------- Helpers ----------
     def _update_clear_label(self):
         self.clear_btn.text = "AC" if self.display.get_main() == "0" else "C"
 
     def _ends_with_operator(self, s: str) -> bool:
-        return bool(s) and s[-1] in "+-*/"
+        return bool(trailing_operator(s))
 
     # ---------- Input ----------
     def add_digit(self, btn):
@@ -379,6 +285,10 @@ class AndroidCalculator(BoxLayout):
             self.display.set_main(value)
             self.display.set_history("")
             self.just_evaluated = False
+        elif re.search(r"(?<![\d.])[A-Za-z]+$|[)%]$", current):
+            # a digit after a constant/variable name, ")" or "%" multiplies it: π 2 is pi*2, not the name pi2
+            # (the 1e of 1e5 is exponent notation, not the name e, so it is left alone)
+            self.display.set_main(current + "*" + value)
         else:
             self.display.set_main(value if current == "0" else current + value)
 
@@ -405,15 +315,8 @@ class AndroidCalculator(BoxLayout):
             self._update_clear_label()
             return
 
-        last_break = max(
-            current.rfind("+"),
-            current.rfind("-"),
-            current.rfind("*"),
-            current.rfind("/"),
-            current.rfind("("),
-            current.rfind(")"),
-        )
-        segment = current[last_break + 1:] if last_break >= 0 else current
+        # the number being typed is the run of digits/dots at the end, whatever operator comes before it
+        segment = re.search(r"[\d.]*$", current).group()
         if "." in segment:
             return
 
@@ -430,9 +333,8 @@ class AndroidCalculator(BoxLayout):
         if self.just_evaluated:
             self.just_evaluated = False
 
-        # replace trailing operator
-        if self._ends_with_operator(current):
-            current = current[:-1]
+        # replace trailing operator (may be more than one character, e.g. //)
+        current = current[:len(current) - len(trailing_operator(current))]
 
         if not current:
             current = "0"
@@ -441,6 +343,26 @@ class AndroidCalculator(BoxLayout):
         self.display.set_history(current + op)
         self._update_clear_label()
 
+    def add_scientific(self, btn):
+        self._insert(self._sci_inserts[btn.text])
+
+    def _insert(self, insert):
+        current = self.display.get_main()
+
+        # a function/constant after "=" (or after an error) starts a new entry, same as a digit
+        if current == "Error" or self.just_evaluated:
+            current = "0"
+            self.display.set_history("")
+            self.just_evaluated = False
+
+        # a constant, variable, function or "(" right after a number or ")" multiplies it: 5 e is 5*e, not
+        # the start of 5e-1 (exponent notation), and 2 π is 2*pi instead of an unknown name
+        if current != "0" and (insert[0].isalpha() or insert[0] == "(") and (current[-1].isalnum() or current[-1] in ".)%"):
+            insert = "*" + insert
+
+        self.display.set_main(insert if current == "0" else current + insert)
+        self._update_clear_label()
+
     def backspace(self, _):
         current = self.display.get_main()
 
@@ -477,7 +399,7 @@ class AndroidCalculator(BoxLayout):
         core = expr[:-1] if has_percent else expr
 
         # If ends with "(-number)" -> unwrap to "number"
-        m = re.search(r"\(\-(\d+(?:\.\d*)?|\.\d+)\)$", core)
+        m = re.search(r"\(\-((?:\d+(?:\.\d*)?|\.\d+)(?:e[+-]?\d+)?)\)$", core)
         if m:
             start = m.start()
             number = m.group(1)
@@ -487,7 +409,7 @@ class AndroidCalculator(BoxLayout):
             return
 
         # If ends with plain number -> wrap it as (-number) OR remove unary "-" like "*-5"
-        m = re.search(r"(\d+(?:\.\d*)?|\.\d+)$", core)
+        m = re.search(r"((?:\d+(?:\.\d*)?|\.\d+)(?:e[+-]?\d+)?)$", core)
         if not m:
             return
 
@@ -495,7 +417,7 @@ class AndroidCalculator(BoxLayout):
         number = m.group(1)
 
         # If it's already unary-negative like "...*-5" or "...+-5" -> remove unary minus
-        if start > 0 and core[start - 1] == "-" and (start == 1 or core[start - 2] in "+-*/("):
+        if start > 0 and core[start - 1] == "-" and (start == 1 or core[start - 2] == "(" or self._ends_with_operator(core[:start - 1])):
             new_core = core[:start - 1] + number
         else:
             new_core = core[:start] + f"(-{number})"
@@ -511,7 +433,7 @@ class AndroidCalculator(BoxLayout):
             return
 
         # Plain number => convert immediately (100 -> 1)
-        if re.fullmatch(r"\s*[\+\-]?(?:\d+(?:\.\d*)?|\.\d+)\s*", expr):
+        if re.fullmatch(r"\s*[\+\-]?(?:\d+(?:\.\d*)?|\.\d+)(?:e[+-]?\d+)?\s*", expr):
             try:
                 value = float(expr)
                 self.display.set_main(format_result(value / 100.0))
@@ -528,6 +450,55 @@ class AndroidCalculator(BoxLayout):
         self.display.set_main(expr + "%")
         self._update_clear_label()
 
+    # ---------- Variables: a ≔ 3*b (shown as a=3*b, stored when "=" is pressed) ----------
+    def assign(self, _):
+        current = self.display.get_main()
+        if current in self._var_names:
+            self.display.set_main(current + "=")
+            self.just_evaluated = False
+            self._update_clear_label()
+
+    # ---------- Memory ----------
+    def _current_value(self):
+        # value of the expression on the display, or None if it can't be evaluated
+        expr = self.display.get_main()
+        if expr == "Error" or self._ends_with_operator(expr):
+            return None
+        # for an assignment (c=5) use the value of its right side; only = defines the variable
+        expr = expr.split("=", 1)[-1]
+        try:
+            value = self.variables.evaluate(expr)
+            format_result(value)  # rejects inf/nan
+            return value
+        except Exception:
+            return None
+
+    def memory_add(self, btn):
+        value = self._current_value()
+        if value is None:
+            return
+        self.memory += value if btn.text == "M+" else -value
+        self.display.set_history(f"M = {format_result(self.memory)}")
+        self.display.set_main(format_result(value))
+        self.just_evaluated = True
+        self._update_clear_label()
+
+    def memory_recall(self, _):
+        recalled = format_result(self.memory)
+        current = self.display.get_main()
+        # after an operator or "(" the memory value becomes the next operand, otherwise it starts a new entry
+        if current != "Error" and not self.just_evaluated and (current.endswith("(") or self._ends_with_operator(current)):
+            self._insert(f"(-{recalled[1:]})" if recalled.startswith("-") else recalled)
+        else:
+            self.display.set_history("")
+            self.display.set_main(recalled)
+            self.just_evaluated = False
+            self._update_clear_label()
+
+    def memory_clear(self, _):
+        self.memory = 0.0
+        self.display.set_history("")
+
     # ---------- Evaluate ----------
     def evaluate(self, _):
         expr = self.display.get_main()
@@ -541,7 +512,7 @@ class AndroidCalculator(BoxLayout):
             return
 
         try:
-            result = evaluate_expression(expr)
+            result = self.variables.evaluate(expr)
             self.display.set_history(expr)
             self.display.set_main(format_result(result))
             self.just_evaluated = True
@@ -558,10 +529,54 @@ class AndroidCalculator(BoxLayout):
             self._update_clear_label()
 
 
+# ---------------- Modes ----------------
+# The other modes live in their own modules; a mode's module (and NumPy, for graph and stats) is only
+# imported, and its screen only built, the first time that mode is picked.
+
+MODES = {
+    "Calculator": None,
+    "Graph": ("graph_view", "GraphScreen"),
+    "Table": ("table_view", "TableScreen"),
+    "Worksheet": ("worksheet", "WorksheetScreen"),
+    "Stats": ("stats_view", "StatsScreen"),
+    "Convert": ("unit_view", "ConvertScreen"),
+    "Programmer": ("programmer_view", "ProgrammerScreen"),
+}
+
+
+class CalculatorModes(BoxLayout):
+    """
+    Mode picker on top, the picked mode's screen below.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(orientation="vertical", **kwargs)
+
+        self.mode = Spinner(text="Calculator", values=tuple(MODES), font_size=18, size_hint_y=None, height=40)
+        self.mode.bind(text=self.switch)
+        self.screens = ScreenManager(transition=NoTransition())
+        self._add_screen("Calculator", AndroidCalculator())
+
+        self.add_widget(self.mode)
+        self.add_widget(self.screens)
+
+    def _add_screen(self, name, widget):
+        screen = Screen(name=name)
+        screen.add_widget(widget)
+        self.screens.add_widget(screen)
+
+    def switch(self, _, name):
+        if not self.screens.has_screen(name):
+            module, cls = MODES[name]
+            self._add_screen(name, getattr(importlib.import_module(module), cls)())
+        self.screens.current = name
+
+
 class AndroidCalculatorApp(App):
     def build(self):
+        Window.size = (360, 780)  # nicer default window size on desktop (ignored on Android)
+        Window.clearcolor = BLACK  # iPhone-style black background
         self.title = "Android Calculator"
-        return AndroidCalculator()
+        return CalculatorModes()
 
 
 if __name__ == "__main__":
@@ -5,8 +5,7 @@ from kivy.uix.textinput import TextInput
 from kivy.uix.button import Button
 from kivy.core.window import Window
 
-# Optional: nicer default window size on desktop (ignored on Android)
-Window.size = (360, 640)
+from calculator_engine import evaluate_expression, format_result, trailing_operator
 
 
 class CalculatorUI(BoxLayout):
@@ -112,10 +111,8 @@ class CalculatorUI(BoxLayout):
             self.just_evaluated = False
 
         # Replace trailing operator if user taps operators repeatedly
-        if txt and txt[-1] in "+-*/":
-            self.set_text(txt[:-1] + op)
-        else:
-            self.set_text(txt + op)
+        trailing = trailing_operator(txt)
+        self.set_text(txt[:len(txt) - len(trailing)] + op)
 
     def toggle_sign(self, _btn) -> None:
         txt = self.get_text()
@@ -153,29 +150,22 @@ class CalculatorUI(BoxLayout):
             val = float(chunk)
             val = val / 100.0
             # Compact formatting
-            new_chunk = self._fmt_number(val)
+            new_chunk = format_result(val)
             self.set_text(txt[:start] + new_chunk + txt[end:])
-        except ValueError:
+        except (ValueError, OverflowError):
             pass
 
     def evaluate(self, _btn) -> None:
         expr = self.get_text()
 
-        # Avoid eval on trailing operator
-        if expr and expr[-1] in "+-*/":
-            expr = expr[:-1]
-
-        # Basic safety: allow only digits/operators/decimal/space/percent sign removed earlier
-        allowed = set("0123456789+-*/.() ")
-        if any(ch not in allowed for ch in expr):
-            self.set_text("Error")
-            self.just_evaluated = True
-            return
+        # Avoid evaluating a trailing operator
+        expr = expr[:len(expr) - len(trailing_operator(expr))]
 
         try:
-            # Python eval handles operator precedence
-            result = eval(expr, {"__builtins__": None}, {})
-            self.set_text(self._fmt_number(result))
+            # Shared tokenizer/RPN engine handles operator precedence (no eval)
+            result = evaluate_expression(expr)
+            # same display rules as the other screens: 12 significant digits, scientific for very large/small
+            self.set_text(format_result(result))
         except Exception:
             self.set_text("Error")
 
@@ -203,25 +193,17 @@ class CalculatorUI(BoxLayout):
         # Handle negative sign for the chunk if it's a unary minus
         if i >= 0 and txt[i] == "-":
             # Unary if at beginning or preceded by an operator
-            if i == 0 or txt[i - 1] in "+-*/(":
+            if i == 0 or txt[i - 1] == "(" or trailing_operator(txt[:i]):
                 i -= 1
 
         start = i + 1
         end = len(txt)
         return start, end, txt[start:end]
 
-    def _fmt_number(self, n) -> str:
-        try:
-            # Convert ints like 5.0 -> 5
-            if isinstance(n, float) and n.is_integer():
-                return str(int(n))
-            return str(n)
-        except Exception:
-            return "Error"
-
 
 class AndroidCalculatorApp(App):
     def build(self):
+        Window.size = (360, 640)  # nicer default window size on desktop (ignored on Android)
         self.title = "Android Calculator (Prototype)"
         return CalculatorUI()
 
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from calculator_engine import evaluate_expression, format_result
+from expression_dag import ExpressionDAG
+
+# ---------------- Local evaluation service ----------------
+# Serves the same engine the app uses as JSON Lines (one JSON object per line) over TCP or a Unix socket,
+# so other tools get exactly the calculator's results without starting a Python process per call.
+#
+#   {"id": 1, "expr": "2+3*4"}             -> {"id": 1, "value": 14.0, "text": "14"}
+#   {"id": 2, "batch": ["1/0", "sqrt(9)"]} -> {"id": 2, "results": [{"error": "Division by zero"},
+#                                                                    {"value": 3.0, "text": "3"}]}
+#
+# Clients can send many requests without waiting for answers (pipelining); answers come back in request order.
+# Small requests are answered straight from the event loop, so every connection shares compile_expression's
+# cache. Long expressions and big batches go to a bounded process pool instead, so one heavy request can't
+# stall everyone else.
+
+HEAVY_CHARS = 4096      # an expression (or batch) with more characters than this goes to the pool
+HEAVY_BATCH = 256       # same for batches with more expressions; big batches are split into chunks of this size
+MAX_LINE = 1 << 20      # longest request line accepted
+MAX_PIPELINE = 128      # unanswered requests per connection before we stop reading from it
+
+# batches that repeat work are evaluated on a shared DAG (one per process): a subexpression repeated within
+# the batch, or across recent batches, is computed once. Interning costs more than it saves on a batch of
+# distinct expressions, so that stays on the plain path unless the client asks ("share": true).
+_DAG = ExpressionDAG()
+
+
+def evaluate_one(expr: str) -> dict:
+    try:
+        value = evaluate_expression(expr)
+        return {"value": value, "text": format_result(value)}
+    except (ValueError, ZeroDivisionError, OverflowError) as exc:
+        return {"error": str(exc)}
+
+
+def evaluate_many(exprs, share: bool | None = None) -> list:
+    # share=None: use the DAG only if the batch has repeated expressions
+    if share is None:
+        share = len(set(exprs)) < len(exprs)
+    if not share:
+        return [evaluate_one(expr) for expr in exprs]
+
+    results = []
+    for value in _DAG.evaluate_batch(exprs):
+        if isinstance(value, Exception):
+            results.append({"error": str(value)})
+            continue
+        try:
+            results.append({"value": value, "text": format_result(value)})
+        except OverflowError as exc:  # inf / nan
+            results.append({"error": str(exc)})
+    return results
+
+
+class CalculatorService:
+    def __init__(self, workers: int | None = None):
+        # workers=0 evaluates everything in the event loop (for platforms without multiprocessing)
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        self.pool = ProcessPoolExecutor(workers) if workers else None
+        self._slots = asyncio.Semaphore(2 * max(workers, 1))
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+    async def handle(self, reader, writer):
+        # reading and writing run separately, so a client can keep sending while earlier answers are computed
+        pending = asyncio.Queue(MAX_PIPELINE)
+        sender = asyncio.create_task(self._send(pending, writer))
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # longer than MAX_LINE
+                    await pending.put({"id": None, "error": "Request too long"})
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    await pending.put(self._answer(line))
+        except ConnectionError:
+            pass
+        finally:
+            if not sender.done():
+                await pending.put(None)
+            await asyncio.gather(sender, return_exceptions=True)
+            writer.close()
+
+    async def _send(self, pending, writer):
+        connected = True
+        while (answer := await pending.get()) is not None:
+            if not isinstance(answer, dict):
+                try:
+                    answer = await answer
+                except Exception:  # the _offload_* tasks answer their own errors; this is the last resort
+                    answer = {"id": None, "error": "Server error"}
+            if not connected:
+                continue  # keep emptying the queue so the reader never blocks on a dead connection
+            try:
+                writer.write(json.dumps(answer).encode() + b"\n")
+                # flush once the client has caught up, not after every line of a pipelined burst
+                if pending.empty():
+                    await writer.drain()
+            except ConnectionError:
+                connected = False
+        if connected:
+            await writer.drain()
+
+    def _answer(self, line: bytes):
+        # a finished answer, or a task that will produce one
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {"id": None, "error": "Invalid JSON"}
+        if not isinstance(request, dict):
+            return {"id": None, "error": "Request must be a JSON object"}
+
+        rid = request.get("id")
+        expr = request.get("expr")
+        batch = request.get("batch")
+        share = request.get("share")
+        if share is not None and not isinstance(share, bool):
+            return {"id": rid, "error": '"share" must be true or false'}
+
+        if isinstance(expr, str):
+            if self.pool is None or len(expr) <= HEAVY_CHARS:
+                return {"id": rid, **evaluate_one(expr)}
+            return asyncio.ensure_future(self._offload_one(rid, expr))
+
+        if isinstance(batch, list) and all(isinstance(e, str) for e in batch):
+            if self.pool is None or (len(batch) <= HEAVY_BATCH and sum(map(len, batch)) <= HEAVY_CHARS):
+                return {"id": rid, "results": evaluate_many(batch, share)}
+            if share is None:  # decided on the whole batch, not per chunk
+                share = len(set(batch)) < len(batch)
+            return asyncio.ensure_future(self._offload_batch(rid, batch, share))
+
+        return {"id": rid, "error": 'Expected "expr" (a string) or "batch" (a list of strings)'}
+
+    async def _run(self, fn, arg):
+        # at most 2 jobs per worker in flight; the rest wait here instead of piling up in the pool's queue
+        async with self._slots:
+            return await asyncio.get_running_loop().run_in_executor(self.pool, fn, arg)
+
+    # A pool job can fail for reasons the engine doesn't catch (a crashed worker is BrokenProcessPool,
+    # MemoryError, RecursionError) or be cancelled when the pool shuts down. The request still gets an
+    # answer with its id, so the connection carries on.
+
+    async def _offload_one(self, rid, expr):
+        try:
+            return {"id": rid, **await self._run(evaluate_one, expr)}
+        except (Exception, asyncio.CancelledError) as exc:
+            return {"id": rid, "error": f"Server error: {type(exc).__name__}"}
+
+    async def _offload_batch(self, rid, batch, share):
+        chunks = [batch[i:i + HEAVY_BATCH] for i in range(0, len(batch), HEAVY_BATCH)]
+        job = partial(evaluate_many, share=share)
+        try:
+            parts = await asyncio.gather(*(self._run(job, chunk) for chunk in chunks))
+        except (Exception, asyncio.CancelledError) as exc:
+            return {"id": rid, "error": f"Server error: {type(exc).__name__}"}
+        return {"id": rid, "results": [result for part in parts for result in part]}
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8765, path: str | None = None, workers: int | None = None):
+    service = CalculatorService(workers)
+    try:
+        if path:
+            server = await asyncio.start_unix_server(service.handle, path, limit=MAX_LINE)
+        else:
+            server = await asyncio.start_server(service.handle, host, port, limit=MAX_LINE)
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calculator evaluation service (JSON Lines)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=None, help="processes for heavy requests (0 = none)")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,754 @@
+from __future__ import annotations
+
+import math
+import operator
+import re
+from fractions import Fraction
+from functools import lru_cache
+
+# ---------------- Shared expression engine ----------------
+# ---------------- Every calculator screen (android_calculator.py, the Logic Update file and the Updated Source Code file) ----------------
+# ---------------- evaluates through this tokenizer -> RPN -> stack machine instead of Python's eval() ----------------
+
+_NUM_RE = re.compile(
+    r"""
+    (?:
+        (?:\d+(?:\.\d*)?)   # 12 or 12. or 12.3
+      | (?:\.\d+)           # .5
+    )
+    (?:e[+-]?\d+)?         # 1.5e20 / 1e-11 (scientific results fed back in)
+""",
+    re.VERBOSE,
+)
+
+
+# ---------------- Scientific functions / constants ----------------
+# Functions must be followed by "(" e.g. sqrt(9), sin(pi/2). Trig uses radians, log is base 10, ln is natural log.
+
+_FUNCS = {
+    "sqrt": math.sqrt,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "log": math.log10,
+    "ln": math.log,
+    "exp": math.exp,
+}
+
+_CONSTS = {
+    "pi": math.pi,
+    "e": math.e,
+}
+
+
+# valid variable names (x in graphing mode, a/b/c/d on the keypad, L1.. in the worksheet)
+_IDENT_RE = re.compile(r"[A-Za-z_]\w*")
+
+
+# ---------------- Units ----------------
+# A number directly followed by a unit (5km, 300 m, 20C) is converted to its dimension's base unit while
+# tokenizing, so 5km + 300m = 5300. Ending with "to <unit>" converts the result: 5km + 300m to mi = 3.29...
+# "to" only changes the unit of the result, never the value: X to <base unit> is always X. A lone reading
+# (1ft to in, -5C to F) goes straight to the target with its pair's factor, so it is exact like convert().
+# Temperatures are readings, converted with an offset (20C to F = 68).
+#
+# dimension -> (base unit, {unit: how many base units one unit is}); temperature units are (scale, offset)
+_UNIT_DEFS = {
+    "length": ("m", {
+        "mm": "0.001", "cm": "0.01", "m": "1", "km": "1000",
+        "in": "0.0254", "ft": "0.3048", "yd": "0.9144", "mi": "1609.344",
+    }),
+    "mass": ("g", {
+        "mg": "0.001", "g": "1", "kg": "1000", "t": "1000000", "oz": "28.349523125", "lb": "453.59237",
+    }),
+    "volume": ("L", {
+        "mL": "0.001", "L": "1", "m3": "1000", "tsp": "0.00492892159375", "tbsp": "0.01478676478125",
+        "floz": "0.0295735295625", "cup": "0.2365882365", "pt": "0.473176473", "qt": "0.946352946",
+        "gal": "3.785411784",
+    }),
+    "temperature": ("K", {
+        "K": ("1", "0"), "C": ("1", "273.15"), "F": (Fraction(5, 9), Fraction("459.67") * Fraction(5, 9)),
+    }),
+    "data": ("B", {
+        "bit": "0.125", "B": "1", "KB": "1e3", "MB": "1e6", "GB": "1e9", "TB": "1e12",
+        "KiB": str(2 ** 10), "MiB": str(2 ** 20), "GiB": str(2 ** 30), "TiB": str(2 ** 40),
+    }),
+}
+
+UNITS = {}          # dimension -> unit names, in the order above
+_UNITS = {}         # unit -> dimension
+_BASE_UNITS = {}    # dimension -> base unit
+_FACTORS = {}       # (from unit, to unit) -> (scale, shift): to = from*scale + shift
+
+# every pair within a dimension is worked out once here, exactly (Fraction) and rounded to float once,
+# so convert() is one dict lookup and one multiply-add with no chaining through the base unit
+for _dimension, (_base, _defs) in _UNIT_DEFS.items():
+    _BASE_UNITS[_dimension] = _base
+    UNITS[_dimension] = tuple(_defs)
+    _exact = {
+        unit: (Fraction(d[0]), Fraction(d[1])) if isinstance(d, tuple) else (Fraction(d), Fraction(0))
+        for unit, d in _defs.items()
+    }
+    for _a, (_scale_a, _offset_a) in _exact.items():
+        _UNITS[_a] = _dimension
+        for _b, (_scale_b, _offset_b) in _exact.items():
+            # a -> base: x*scale_a + offset_a, base -> b: (y - offset_b) / scale_b
+            _FACTORS[_a, _b] = (float(_scale_a / _scale_b), float((_offset_a - _offset_b) / _scale_b))
+
+
+def convert(value: float, from_unit: str, to_unit: str) -> float:
+    try:
+        scale, shift = _FACTORS[from_unit, to_unit]
+    except KeyError:
+        raise ValueError(f"Can't convert {from_unit} to {to_unit}") from None
+    return value * scale + shift
+
+
+# ---------------- Operator registry ----------------
+# Every operator is described once here: the text typed for it, precedence, associativity, arity and the
+# function that does the work. _build_operator_tables() turns the registry into the lookup tables the
+# lexer, parser, evaluator and keypad use, so adding an operator is one register_operator() call and
+# dispatching it costs the same single dict lookup as + or *.
+#
+# precedence: % > ^ > unary +/- > * / // mod > + - > & > |
+# -2^2 = -(2^2) and 2^3^2 = 2^(3^2), like a scientific calculator
+
+
+class Operator:
+    __slots__ = ("symbol", "text", "prec", "fn", "arity", "fix", "right_assoc")
+
+    def __init__(self, symbol, text, prec, fn, arity, fix, right_assoc):
+        self.symbol = symbol            # name used in RPN, e.g. "u-"
+        self.text = text                # what the user types, e.g. "-"
+        self.prec = prec
+        self.fn = fn
+        self.arity = arity              # 1 or 2
+        self.fix = fix                  # "infix", "prefix" or "postfix"
+        self.right_assoc = right_assoc
+
+
+OPERATORS = {}
+
+_PREC = {}
+_RIGHT_ASSOC = set()
+_PREFIX_OPS = set()
+_BINARY_OPS = {}
+_UNARY_OPS = {}
+_OP_TOKENS = {}      # typed text -> infix/postfix token
+_UNARY_TOKENS = {}   # typed text -> prefix token
+_INFIX_TEXTS = ()    # longest first, for "does the display end with an operator"
+
+
+def register_operator(symbol, prec, fn, *, text=None, fix="infix", right_assoc=None):
+    OPERATORS[symbol] = Operator(
+        symbol,
+        symbol if text is None else text,
+        prec,
+        fn,
+        2 if fix == "infix" else 1,
+        fix,
+        (fix == "prefix") if right_assoc is None else right_assoc,
+    )
+    _build_operator_tables()
+
+
+def _div(a, b):
+    if b == 0:
+        raise ZeroDivisionError("Division by zero")
+    return a / b
+
+
+def _floordiv(a, b):
+    if b == 0:
+        raise ZeroDivisionError("Division by zero")
+    return a // b
+
+
+def _mod(a, b):
+    # result takes the sign of b, like Python's %
+    if b == 0:
+        raise ZeroDivisionError("Division by zero")
+    return a % b
+
+
+def _whole(x):
+    if not float(x).is_integer():
+        raise ValueError("Bitwise operators need whole numbers")
+    return int(x)
+
+
+def _bit_and(a, b):
+    return float(_whole(a) & _whole(b))
+
+
+def _bit_or(a, b):
+    return float(_whole(a) | _whole(b))
+
+
+# ---------------- Lexer ----------------
+# One compiled regex splits the input into token strings in a single C-level findall pass (whitespace is
+# skipped by the scan itself, so there's no copy of the input with the spaces removed). Each token is then
+# classified by a table lookup on its first character instead of a chain of if ch == ... checks.
+# Positions are only worked out when there is an error to report.
+
+# first character -> token class
+_C_NUM, _C_NAME, _C_OP, _C_POSTFIX, _C_LPAREN, _C_RPAREN, _C_BAD = range(7)
+_CHAR_CLASS = {}
+_WORD_OPS = set()    # operators spelled with letters, e.g. mod
+_LEX_RE = None
+
+# "... to mi" at the very end of an expression
+_TO_RE = re.compile(r"\s+to\s+([A-Za-z_]\w*)\s*$")
+
+# shared token tuples, so operators, parentheses, functions, constants and variable names don't allocate
+# a new tuple (and a new copy of the name) every time they appear -- a compiled program holds only references.
+# A 2-field __slots__ object would be 8 bytes smaller than a tuple, but every consumer unpacks tokens with
+# `for kind, val in rpn`, which only runs at C speed for real tuples.
+_LPAREN_TOKEN = ("lparen", "(")
+_RPAREN_TOKEN = ("rparen", ")")
+_FUNC_TOKENS = {name: ("func", name) for name in _FUNCS}
+_CONST_TOKENS = {name: ("num", value) for name, value in _CONSTS.items()}
+_VAR_TOKENS = {}  # filled as variable names are seen (a handful: x, a-d, L1...)
+
+
+def _build_operator_tables():
+    global _LEX_RE, _INFIX_TEXTS
+
+    # tables are filled in place: other modules import them by name
+    for table in (_PREC, _RIGHT_ASSOC, _PREFIX_OPS, _BINARY_OPS, _UNARY_OPS, _OP_TOKENS, _UNARY_TOKENS,
+                  _CHAR_CLASS, _WORD_OPS):
+        table.clear()
+
+    _CHAR_CLASS.update(dict.fromkeys("0123456789.", _C_NUM))
+    _CHAR_CLASS.update(dict.fromkeys("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_", _C_NAME))
+    _CHAR_CLASS.update({"(": _C_LPAREN, ")": _C_RPAREN})
+
+    for op in OPERATORS.values():
+        _PREC[op.symbol] = op.prec
+        if op.right_assoc:
+            _RIGHT_ASSOC.add(op.symbol)
+        (_BINARY_OPS if op.arity == 2 else _UNARY_OPS)[op.symbol] = op.fn
+
+        token = ("op", op.symbol)
+        if op.fix == "prefix":
+            _PREFIX_OPS.add(op.symbol)
+            _UNARY_TOKENS[op.text] = token
+        else:
+            _OP_TOKENS[op.text] = token
+
+        if op.text[0].isalpha():
+            _WORD_OPS.add(op.text)
+        else:
+            _CHAR_CLASS.setdefault(op.text[0], _C_POSTFIX if op.fix == "postfix" else _C_OP)
+
+    _INFIX_TEXTS = tuple(sorted(
+        (op.text for op in OPERATORS.values() if op.fix == "infix"), key=len, reverse=True))
+
+    # multi-character symbols (//) must be tried before the single-character catch-all;
+    # word operators only count when a letter doesn't follow (mod3 is mod 3, model is a name)
+    words = sorted(_WORD_OPS, key=len, reverse=True)
+    symbols = sorted((t for t in _OP_TOKENS if len(t) > 1 and t not in _WORD_OPS), key=len, reverse=True)
+    pattern = "(?:" + _NUM_RE.pattern + ")"
+    if words:
+        pattern += "|(?:" + "|".join(map(re.escape, words)) + ")(?![A-Za-z_])"
+    pattern += r"|[A-Za-z_]\w*"
+    if symbols:
+        pattern += "|" + "|".join(map(re.escape, symbols))
+    pattern += r"|\S"
+    _LEX_RE = re.compile(pattern, re.VERBOSE)
+
+    compile_expression.cache_clear()
+
+
+def trailing_operator(s: str) -> str:
+    # the infix operator text s ends with ("" if none) -- used by the keypad to replace a repeated operator
+    for text in _INFIX_TEXTS:
+        if s.endswith(text):
+            return text
+    return ""
+
+
+def _lex_error(expr: str, index: int, message: str) -> ValueError:
+    # error path only: find where the index-th token starts
+    for n, m in enumerate(_LEX_RE.finditer(expr)):
+        if n == index:
+            return ValueError(f"{message} (position {m.start()})")
+    return ValueError(f"{message} (position {len(expr)})")
+
+
+def _tokenize(expr: str, variables=()):
+    tokens = []
+    append = tokens.append
+    char_class = _CHAR_CLASS.get
+    # +/- are unary unless they follow something that ends an operand: a number, variable, ")" or postfix %
+    after_operand = False
+    func = None  # function name still waiting for its "("
+    dimension = None  # of the units used so far (all must match)
+    literals = []  # (token index, unit) of every number that had a unit
+    merged = 0  # words that didn't become a token of their own (units), for error positions
+
+    target = None
+    if "to" in expr:
+        m = _TO_RE.search(expr)
+        if m:
+            expr, target = expr[:m.start()], m.group(1)
+
+    for text in _LEX_RE.findall(expr):
+        cls = char_class(text[0], _C_BAD)
+
+        if func is not None and cls != _C_LPAREN:
+            raise _lex_error(expr, len(tokens) + merged, f"Expected ( after {func}")
+        func = None
+
+        if cls == _C_NUM:
+            append(("num", float(text)))
+            after_operand = True
+        elif cls == _C_OP:
+            append(_OP_TOKENS[text] if after_operand or text not in _UNARY_TOKENS else _UNARY_TOKENS[text])
+            after_operand = False
+        elif cls == _C_LPAREN:
+            append(_LPAREN_TOKEN)
+            after_operand = False
+        elif cls == _C_RPAREN:
+            append(_RPAREN_TOKEN)
+            after_operand = True
+        elif cls == _C_POSTFIX:
+            append(_OP_TOKENS[text])
+            after_operand = True
+        elif cls == _C_NAME:
+            if text in _WORD_OPS:
+                append(_OP_TOKENS[text])
+                after_operand = False
+            elif after_operand and text in _UNITS and tokens[-1][0] == "num":
+                if dimension is not None and _UNITS[text] != dimension:
+                    raise _lex_error(expr, len(tokens) + merged, f"Can't mix {dimension} and {_UNITS[text]}")
+                dimension = _UNITS[text]
+                value = tokens.pop()[1]
+                # -5C is minus five degrees, not minus (5C in kelvin): the sign belongs to the reading
+                if tokens and tokens[-1] is _UNARY_TOKENS.get("-"):
+                    tokens.pop()
+                    value = -value
+                    merged += 1
+                append(("num", value))  # still in `text`; converted below, once the target is checked
+                literals.append((len(tokens) - 1, text))
+                merged += 1
+            elif variables and text in variables:
+                token = _VAR_TOKENS.get(text)
+                if token is None:
+                    token = ("var", text)
+                    if len(_VAR_TOKENS) < 1024:
+                        _VAR_TOKENS[text] = token
+                append(token)
+                after_operand = True
+            elif text in _CONSTS:
+                append(_CONST_TOKENS[text])
+                after_operand = True
+            elif text in _FUNCS:
+                append(_FUNC_TOKENS[text])
+                func = text
+                after_operand = False
+            elif text in _UNITS:
+                raise _lex_error(expr, len(tokens) + merged, f"Unit needs a number before it: {text}")
+            else:
+                raise _lex_error(expr, len(tokens) + merged, f"Unknown name: {text}")
+        else:
+            raise _lex_error(expr, len(tokens) + merged, f"Invalid character: {text}")
+
+    if func is not None:
+        raise ValueError(f"Expected ( after {func} (position {len(expr)})")
+
+    if target is not None:
+        if target not in _UNITS:
+            raise ValueError(f"Unknown unit: {target}")
+        if dimension is None:
+            raise ValueError(f"No unit to convert to {target}")
+        if _UNITS[target] != dimension:
+            raise ValueError(f"Can't convert {dimension} to {_UNITS[target]}")
+
+    if target is not None and len(tokens) == 1 and literals:
+        # the expression is one reading: convert it directly (same value as going through the base unit)
+        scale, shift = _FACTORS[literals[0][1], target]
+    else:
+        for i, unit in literals:
+            unit_scale, unit_shift = _FACTORS[unit, _BASE_UNITS[dimension]]
+            tokens[i] = ("num", tokens[i][1] * unit_scale + unit_shift)
+        if target is not None:
+            scale, shift = _FACTORS[_BASE_UNITS[dimension], target]
+
+    if target is not None:
+        tokens = [_LPAREN_TOKEN, *tokens, _RPAREN_TOKEN, _OP_TOKENS["*"], ("num", scale)]
+        if shift:
+            tokens += [_OP_TOKENS["+"], ("num", shift)]
+
+    return tokens
+
+
+def _to_rpn(tokens, prec=_PREC, right_assoc=_RIGHT_ASSOC, prefix_ops=_PREFIX_OPS):
+    # the operator tables default to the calculator's; programmer mode passes its integer operators
+    output = []
+    stack = []
+    prev_kind = None
+
+    # tokens are moved, never rebuilt, so the shared token tuples stay shared in the program
+    for token in tokens:
+        kind, val = token
+        if kind in ("num", "var"):
+            output.append(token)
+        elif kind == "op":
+            o1 = val
+            # prefix operators have no left operand yet, so nothing on the stack can be applied
+            if o1 not in prefix_ops:
+                while stack and stack[-1][0] == "op":
+                    o2 = stack[-1][1]
+                    if ((o1 in right_assoc and prec[o1] < prec[o2]) or
+                            (o1 not in right_assoc and prec[o1] <= prec[o2])):
+                        output.append(stack.pop())
+                    else:
+                        break
+            stack.append(token)
+        elif kind in ("lparen", "func"):
+            stack.append(token)
+        elif kind == "rparen":
+            if prev_kind == "lparen":
+                raise ValueError("Empty parentheses")
+            while stack and stack[-1][0] != "lparen":
+                output.append(stack.pop())
+            if not stack or stack[-1][0] != "lparen":
+                raise ValueError("Mismatched parentheses")
+            stack.pop()
+            # sin(x)^2 applies sin to what's inside its own parentheses
+            if stack and stack[-1][0] == "func":
+                output.append(stack.pop())
+        else:
+            raise ValueError("Unknown token")
+        prev_kind = kind
+
+    while stack:
+        if stack[-1][0] in ("lparen", "rparen"):
+            raise ValueError("Mismatched parentheses")
+        output.append(stack.pop())
+
+    return output
+
+
+def _eval_rpn(rpn, env=None):
+    st = []
+    for kind, val in rpn:
+        if kind == "num":
+            st.append(val)
+            continue
+
+        if kind == "var":
+            st.append(env[val])
+            continue
+
+        if kind == "func":
+            if not st:
+                raise ValueError(f"Missing argument for {val}")
+            st.append(_FUNCS[val](st.pop()))
+            continue
+
+        fn = _UNARY_OPS.get(val)
+        if fn is not None:  # % and the unary +/- buttons
+            if not st:
+                raise ValueError(f"Missing operand for {val}")
+            st.append(fn(st.pop()))
+            continue
+
+        fn = _BINARY_OPS.get(val)
+        if fn is None:
+            raise ValueError("Unknown operator")
+        if len(st) < 2:
+            raise ValueError("Missing operand for binary")
+        b = st.pop()
+        st.append(fn(st.pop(), b))
+
+    if len(st) != 1:
+        raise ValueError("Invalid expression")
+    return st[0]
+
+
+# ---------------- Compiled program cache ----------------
+# Pressing "=" on the same expression again (or re-running an expression from history) reuses the RPN program
+# that was already built, so only the stack machine runs. Invalid expressions raise and are not cached.
+
+def _check_arity(rpn, unary_ops=_UNARY_OPS):
+    # walks the stack depth once so "5+" or "x*" fail when compiled, not every time they're evaluated
+    depth = 0
+    for kind, val in rpn:
+        if kind in ("num", "var"):
+            depth += 1
+        elif kind == "func" or val in unary_ops:
+            if depth < 1:
+                raise ValueError("Invalid expression")
+        else:
+            if depth < 2:
+                raise ValueError("Invalid expression")
+            depth -= 1
+    if depth != 1:
+        raise ValueError("Invalid expression")
+
+
+@lru_cache(maxsize=256)
+def compile_expression(expr: str, variables: tuple = ()) -> tuple:
+    rpn = tuple(_to_rpn(_tokenize(expr, variables)))
+    _check_arity(rpn)
+    return rpn
+
+
+def evaluate_expression(expr: str) -> float:
+    return _eval_rpn(compile_expression(expr))
+
+
+# ---------------- Built-in operators ----------------
+# math.pow raises ValueError for (-8)^0.5 instead of returning a complex number like ** does
+
+register_operator("|", 1, _bit_or)
+register_operator("&", 2, _bit_and)
+register_operator("+", 3, operator.add)
+register_operator("-", 3, operator.sub)
+register_operator("*", 4, operator.mul)
+register_operator("/", 4, _div)
+register_operator("//", 4, _floordiv)
+register_operator("mod", 4, _mod)
+register_operator("u+", 5, operator.pos, text="+", fix="prefix")
+register_operator("u-", 5, operator.neg, text="-", fix="prefix")
+register_operator("^", 6, math.pow, right_assoc=True)
+register_operator("%", 7, lambda x: x / 100.0, fix="postfix")  # percent fix after test plan : x% = x/100
+
+
+# ---------------- Compiled closures ----------------
+# For expressions that get re-run with different variable values: the RPN program is turned into nested
+# closures once. Variables are read by slot index from a plain list (values[i]), so re-running costs
+# only the arithmetic -- no tokenizing, no string substitution, no dict lookups by name.
+# Running nested closures recurses once per level, so a very deep expression (a worksheet total of a thousand
+# lines) gets the iterative stack machine instead, with its variables turned into slot indexes.
+
+MAX_CLOSURE_DEPTH = 200
+
+
+def _const(c):
+    return lambda values: c
+
+
+def _load(slot):
+    return lambda values: values[slot]
+
+
+def _apply1(fn, a):
+    return lambda values: fn(a(values))
+
+
+def _apply2(fn, a, b):
+    return lambda values: fn(a(values), b(values))
+
+
+def compile_closure(rpn, slots):
+    """
+    rpn: output of compile_expression, slots: variable name -> index into the values list.
+    Constant subexpressions like (1+0.0825) are folded while compiling.
+    """
+    st = []  # (closure, constant value or None, nesting depth)
+    for kind, val in rpn:
+        if kind == "num":
+            st.append((_const(val), val, 1))
+            continue
+        if kind == "var":
+            st.append((_load(slots[val]), None, 1))
+            continue
+
+        if kind == "func" or val in _UNARY_OPS:
+            fn = _FUNCS[val] if kind == "func" else _UNARY_OPS[val]
+            args = [st.pop()]
+        else:
+            fn = _BINARY_OPS[val]
+            b = st.pop()
+            args = [st.pop(), b]
+
+        if all(c is not None for _, c, _ in args):
+            try:
+                c = fn(*(c for _, c, _ in args))
+                st.append((_const(c), c, 1))
+                continue
+            except (ValueError, ZeroDivisionError, OverflowError):
+                pass  # leave it to raise when the program actually runs
+        depth = 1 + max(d for _, _, d in args)
+        if depth > MAX_CLOSURE_DEPTH:
+            indexed = tuple(("var", slots[v]) if k == "var" else (k, v) for k, v in rpn)
+            return lambda values: _eval_rpn(indexed, values)
+        if len(args) == 1:
+            st.append((_apply1(fn, args[0][0]), None, depth))
+        else:
+            st.append((_apply2(fn, args[0][0], args[1][0]), None, depth))
+
+    return st[0][0]
+
+
+# ---------------- Named variables ----------------
+
+class VariableStore:
+    """
+    Named variables like a = 3*b.
+    A variable defined by a formula keeps its compiled program; changing b re-runs only the programs that
+    (directly or indirectly) read b, in dependency order.
+    """
+
+    MAX_PROGRAMS = 256
+
+    def __init__(self):
+        self._slots = {}       # name -> slot index
+        self.values = []       # slot index -> current value
+        self._formulas = {}    # name -> (closure, names it reads)
+        self._dependents = {}  # name -> names whose formula reads it
+        self._programs = {}    # expression -> (closure, names it reads)
+
+    def names(self):
+        return tuple(sorted(self._slots))
+
+    def get(self, name: str) -> float:
+        return self.values[self._slots[name]]
+
+    def _check_name(self, name: str):
+        # a unit name can't be a variable either: after m=2, 3m would still read as 3 meters
+        if not _IDENT_RE.fullmatch(name) or name in _FUNCS or name in _CONSTS or name in _UNITS:
+            raise ValueError(f"Invalid variable name: {name}")
+
+    def _slot_for(self, name: str) -> int:
+        self._check_name(name)
+        slot = self._slots.get(name)
+        if slot is None:
+            slot = self._slots[name] = len(self.values)
+            self.values.append(0.0)
+            self._programs.clear()  # expressions that failed on the unknown name may compile now
+        return slot
+
+    def program(self, expr: str):
+        # compiled closure + the variable names it reads; cached per expression text
+        found = self._programs.get(expr)
+        if found is None:
+            rpn = compile_expression(expr, self.names())
+            reads = frozenset(val for kind, val in rpn if kind == "var")
+            found = (compile_closure(rpn, self._slots), reads)
+            if len(self._programs) >= self.MAX_PROGRAMS:
+                self._programs.clear()
+            self._programs[expr] = found
+        return found
+
+    def evaluate(self, text: str) -> float:
+        # "a=3*b" defines a; anything else is a plain expression that may use variables
+        if "=" in text:
+            name, expr = text.split("=", 1)
+            return self.define(name.strip(), expr)
+        closure, _ = self.program(text)
+        return closure(self.values)
+
+    def set(self, name: str, value: float):
+        # plain value: drops any formula name had
+        slot = self._slot_for(name)
+        self._unlink(name)
+        self.values[slot] = value
+        self._recompute_dependents(name)
+
+    def define(self, name: str, expr: str) -> float:
+        self._check_name(name)
+        closure, reads = self.program(expr)
+        if name in reads or reads & self._all_dependents(name):
+            raise ValueError("Circular reference")
+
+        value = closure(self.values)  # raises before anything changes if it can't be evaluated
+        slot = self._slot_for(name)
+        self._unlink(name)
+        self._formulas[name] = (closure, reads)
+        for dep in reads:
+            self._dependents.setdefault(dep, set()).add(name)
+        self.values[slot] = value
+        self._recompute_dependents(name)
+        return value
+
+    def _unlink(self, name):
+        old = self._formulas.pop(name, None)
+        if old is not None:
+            for dep in old[1]:
+                self._dependents[dep].discard(name)
+
+    def _all_dependents(self, name):
+        seen = set()
+        todo = [name]
+        while todo:
+            for dep in self._dependents.get(todo.pop(), ()):
+                if dep not in seen:
+                    seen.add(dep)
+                    todo.append(dep)
+        return seen
+
+    def _recompute_dependents(self, name):
+        # depth-first post-order gives a reverse topological order of everything downstream of name
+        order = []
+        seen = set()
+
+        def visit(n):
+            for dep in self._dependents.get(n, ()):
+                if dep not in seen:
+                    seen.add(dep)
+                    visit(dep)
+                    order.append(dep)
+
+        visit(name)
+        for dep in reversed(order):
+            closure, _ = self._formulas[dep]
+            try:
+                self.values[self._slots[dep]] = closure(self.values)
+            except (ValueError, ZeroDivisionError, OverflowError):
+                self.values[self._slots[dep]] = float("nan")  # shows as Error until its inputs are fixed
+
+
+# ---------------- Result formatting ----------------
+# Results use the shortest text that reads back as the same float (repr). If that doesn't fit on the display
+# the value is rounded to fit, switching to scientific notation for very large or very small magnitudes.
+# Recent results are cached because history/batch output keeps formatting the same values.
+
+DISPLAY_WIDTH = 14
+
+
+def _fmt_scientific(x: float, width: int) -> str:
+    # shortest mantissa that round-trips, then trimmed down until it fits the width
+    digits = 0
+    while digits < 17:
+        s = f"{x:.{digits}e}"
+        if float(s) == x:
+            break
+        digits += 1
+
+    while True:
+        mantissa, exp = s.split("e")
+        if "." in mantissa:
+            mantissa = mantissa.rstrip("0").rstrip(".")
+        s = f"{mantissa}e{int(exp)}"
+        if len(s) <= width or digits == 0:
+            return s
+        digits = max(0, digits - (len(s) - width))
+        s = f"{x:.{digits}e}"
+
+
+@lru_cache(maxsize=1024)
+def format_result(x: float, width: int = DISPLAY_WIDTH) -> str:
+    x = float(x)
+    if x != x or x in (float("inf"), float("-inf")):
+        raise OverflowError("Result out of range")
+
+    if x.is_integer():
+        s = str(int(x))
+        return s if len(s) <= width else _fmt_scientific(x, width)
+
+    s = repr(x)
+    if "e" in s:  # |x| < 1e-4 or |x| >= 1e16
+        return _fmt_scientific(x, width)
+    if len(s) <= width:
+        return s
+
+    # plain decimal that's too long: round the fraction to whatever room is left
+    int_len = s.index(".")
+    if int_len + 2 > width:
+        return _fmt_scientific(x, width)
+    s = f"{x:.{width - int_len - 1}f}".rstrip("0").rstrip(".")
+    return "0" if s in ("", "-0") else s
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+# ---------------- Undo / redo ----------------
+# The calculator's state is a small tuple: (display, history, just_evaluated, memory).
+# Instead of a copy of that state per step, each step stores only what changed -- how many characters of the
+# old display/history text to keep plus the characters added after them -- and every CHECKPOINT steps a full
+# state is stored. Any step is rebuilt from the checkpoint at or before it plus at most CHECKPOINT-1 replayed
+# edits, so undoing one step or ten thousand takes the same time.
+
+
+def _diff(old: str, new: str):
+    # (characters of old to keep, text added after them); typing and backspace hit the first two cases
+    if new.startswith(old):
+        return len(old), new[len(old):]
+    if old.startswith(new):
+        return len(new), ""
+    keep = 0
+    limit = min(len(old), len(new))
+    while keep < limit and old[keep] == new[keep]:
+        keep += 1
+    return keep, new[keep:]
+
+
+class EditLog:
+    CHECKPOINT = 64
+
+    def __init__(self, state):
+        self._edits = [None]          # _edits[i] turns step i-1 into step i; step 0 is the starting state
+        self._checkpoints = [state]   # full states of steps 0, CHECKPOINT, 2*CHECKPOINT, ...
+        self.position = 0
+        self.current = state
+
+    def __len__(self):
+        return len(self._edits)
+
+    def can_undo(self) -> bool:
+        return self.position > 0
+
+    def can_redo(self) -> bool:
+        return self.position < len(self._edits) - 1
+
+    def record(self, state) -> bool:
+        """
+        Adds state as the next step (after an undo, the steps that could have been redone are dropped).
+        Returns False if nothing changed.
+        """
+        if state == self.current:
+            return False
+
+        main, history, just_evaluated, memory = state
+        edit = (*_diff(self.current[0], main), *_diff(self.current[1], history), just_evaluated, memory)
+
+        del self._edits[self.position + 1:]
+        del self._checkpoints[self.position // self.CHECKPOINT + 1:]
+
+        self._edits.append(edit)
+        self.position += 1
+        if self.position % self.CHECKPOINT == 0:
+            self._checkpoints.append(state)
+        self.current = state
+        return True
+
+    def goto(self, position: int):
+        # state of step `position` (clamped to the steps that exist)
+        position = min(max(position, 0), len(self._edits) - 1)
+        base = position - position % self.CHECKPOINT
+
+        main, history, just_evaluated, memory = self._checkpoints[base // self.CHECKPOINT]
+        for i in range(base + 1, position + 1):
+            main_keep, main_add, history_keep, history_add, just_evaluated, memory = self._edits[i]
+            main = main[:main_keep] + main_add
+            history = history[:history_keep] + history_add
+
+        self.position = position
+        self.current = (main, history, just_evaluated, memory)
+        return self.current
+
+    def undo(self, steps: int = 1):
+        return self.goto(self.position - steps)
+
+    def redo(self, steps: int = 1):
+        return self.goto(self.position + steps)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import weakref
+from collections import OrderedDict
+
+from calculator_engine import _BINARY_OPS, _FUNCS, _UNARY_OPS, compile_expression
+
+# ---------------- Hash-consed expression DAG ----------------
+# Turns compile_expression's RPN into a DAG where every distinct subexpression exists exactly once.
+# Two copies of (1+0.0825) -- in the same expression, or in different expressions of a batch/history --
+# are the same Node, so its value is computed once and cached on the node.
+#
+# Nodes are interned in a WeakValueDictionary: an entry disappears as soon as nothing uses the node.
+# A small LRU of recently parsed expressions keeps hot subexpressions alive between evaluations (and skips
+# re-parsing repeated history entries). The LRU is limited both in expressions (keep_alive) and in the nodes
+# they hold (max_nodes), so a few huge expressions can't pin an unbounded table.
+#
+# Errors are cached as (type, args) and a fresh exception is raised each time: re-raising one cached
+# instance would keep adding frames to its __traceback__ for as long as the node lives.
+
+
+class Node:
+    __slots__ = ("kind", "op", "args", "has_vars", "value", "error", "__weakref__")
+
+    def __init__(self, kind, op, args):
+        self.kind = kind    # "num", "var", "func", "op"
+        self.op = op        # number, variable name, function name or operator symbol
+        self.args = args    # child Nodes
+        self.has_vars = kind == "var" or any(a.has_vars for a in args)
+        self.value = None   # cached result (only for nodes without variables)
+        self.error = None   # (exception type, args) for constant subtrees that can't be evaluated (1/0)
+
+
+class ExpressionDAG:
+    def __init__(self, keep_alive: int = 1024, max_nodes: int = 20_000):
+        self._table = weakref.WeakValueDictionary()
+        self.keep_alive = keep_alive
+        self.max_nodes = max_nodes
+        self._roots = OrderedDict()  # (expression, variables) -> root Node
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._table)
+
+    def _intern(self, kind, op, args):
+        # children are interned already, so their identity is their structure
+        key = (kind, op, *map(id, args))
+        node = self._table.get(key)
+        if node is None:
+            self.misses += 1
+            node = Node(kind, op, args)
+            self._table[key] = node
+            if not node.has_vars:
+                # its children are built (and so evaluated) first: a constant subtree is computed right here, once
+                self._compute(node, None, None)
+        else:
+            self.hits += 1
+        return node
+
+    def build(self, rpn) -> Node:
+        st = []
+        for kind, val in rpn:
+            if kind in ("num", "var"):
+                st.append(self._intern(kind, val, ()))
+            elif kind == "func" or val in _UNARY_OPS:
+                st.append(self._intern(kind, val, (st.pop(),)))
+            else:
+                b = st.pop()
+                st.append(self._intern(kind, val, (st.pop(), b)))
+        if len(st) != 1:
+            raise ValueError("Invalid expression")
+        return st[0]
+
+    def parse(self, expr: str, variables: tuple = ()) -> Node:
+        key = (expr, variables)
+        root = self._roots.get(key)
+        if root is not None:
+            self._roots.move_to_end(key)
+            return root
+
+        root = self.build(compile_expression(expr, variables))
+        self._roots[key] = root
+        # oldest first; a dropped expression's nodes go with it unless a kept one shares them
+        while self._roots and (len(self._roots) > self.keep_alive or len(self._table) > self.max_nodes):
+            self._roots.popitem(last=False)
+        return root
+
+    def evaluate(self, root: Node, env=None, memo=None) -> float:
+        """
+        Evaluates root. Subtrees without variables were computed when their node was built and stay cached on it;
+        subtrees with variables are cached in memo (one dict per env, shared across a batch).
+        Iterative post-order, so very long expressions don't hit the recursion limit.
+        """
+        memo = {} if memo is None else memo
+        stack = [(root, False)]
+        while stack:
+            node, ready = stack.pop()
+            if self._known(node, memo):
+                continue
+            if not ready:
+                stack.append((node, True))
+                for a in node.args:
+                    if not self._known(a, memo):
+                        stack.append((a, False))
+                continue
+
+            self._compute(node, env, memo)
+
+        return self._result(root, memo)
+
+    @classmethod
+    def _compute(cls, node, env, memo):
+        try:
+            args = [cls._result(a, memo) for a in node.args]
+            if node.kind == "num":
+                value = node.op
+            elif node.kind == "var":
+                value = env[node.op]
+            elif node.kind == "func":
+                value = _FUNCS[node.op](*args)
+            elif node.op in _UNARY_OPS:
+                value = _UNARY_OPS[node.op](*args)
+            else:
+                value = _BINARY_OPS[node.op](*args)
+        except (ValueError, ZeroDivisionError, OverflowError) as exc:
+            if node.has_vars:
+                memo[node] = (type(exc), exc.args)
+            else:
+                node.error = (type(exc), exc.args)
+            return
+
+        if node.has_vars:
+            memo[node] = value
+        else:
+            node.value = value
+
+    def evaluate_batch(self, exprs, env=None, variables: tuple = ()):
+        # one result per expression (or the exception it raised); shared subtrees are evaluated once
+        memo = {}
+        for expr in exprs:
+            try:
+                yield self.evaluate(self.parse(expr, variables), env, memo)
+            except (ValueError, ZeroDivisionError, OverflowError) as exc:
+                yield exc
+
+    @staticmethod
+    def _known(node, memo):
+        if node.has_vars:
+            return node in memo
+        return node.value is not None or node.error is not None
+
+    @staticmethod
+    def _result(node, memo):
+        if node.has_vars:
+            value = memo[node]
+            if isinstance(value, tuple):  # (exception type, args); values are otherwise floats
+                raise value[0](*value[1])
+            return value
+        if node.error is not None:
+            raise node.error[0](*node.error[1])
+        return node.value
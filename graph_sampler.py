@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from calculator_engine import _BINARY_OPS, _UNARY_OPS, compile_expression
+
+# ---------------- Vectorized evaluation ----------------
+# Runs the same RPN program the calculator builds (compile_expression), except every stack value is a NumPy array.
+# One pass over the program evaluates f(x) at every sample point at once.
+
+_NP_FUNCS = {
+    "sqrt": np.sqrt,
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "log": np.log10,
+    "ln": np.log,
+    "exp": np.exp,
+}
+
+_NP_BINARY_OPS = {
+    "+": np.add,
+    "-": np.subtract,
+    "*": np.multiply,
+    "/": np.true_divide,
+    "^": np.power,
+    "//": np.floor_divide,
+    "mod": np.mod,
+    "&": lambda a, b: _np_whole_op(np.bitwise_and, a, b),
+    "|": lambda a, b: _np_whole_op(np.bitwise_or, a, b),
+}
+
+_NP_UNARY_OPS = {
+    "%": lambda v: v / 100.0,
+    "u+": np.positive,
+    "u-": np.negative,
+}
+
+
+def _np_whole_op(ufunc, a, b):
+    # bitwise ops on float arrays: nan wherever either side isn't a whole number
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    whole = np.isfinite(a) & np.isfinite(b) & (a == np.floor(a)) & (b == np.floor(b))
+    result = ufunc(np.where(whole, a, 0).astype(np.int64), np.where(whole, b, 0).astype(np.int64))
+    return np.where(whole, result.astype(float), np.nan)
+
+
+def _np_fallback(fn):
+    # operators registered without a NumPy version: apply the engine's function point by point, nan on error
+    def scalar(*args):
+        try:
+            return float(fn(*args))
+        except (ValueError, ZeroDivisionError, OverflowError):
+            return math.nan
+    return np.vectorize(scalar, otypes=[float])
+
+
+def _np_op(val):
+    op = _NP_BINARY_OPS.get(val) or _NP_UNARY_OPS.get(val)
+    if op is None:
+        op = _np_fallback(_BINARY_OPS[val] if val in _BINARY_OPS else _UNARY_OPS[val])
+        (_NP_BINARY_OPS if val in _BINARY_OPS else _NP_UNARY_OPS)[val] = op
+    return op
+
+
+def eval_rpn_vector(rpn, xs):
+    st = []
+    # 1/0, sqrt(-1), log(0) ... turn into inf/nan instead of raising; those points just break the line
+    with np.errstate(all="ignore"):
+        try:
+            for kind, val in rpn:
+                if kind == "num":
+                    st.append(val)
+                elif kind == "var":
+                    st.append(xs)
+                elif kind == "func":
+                    st.append(_NP_FUNCS[val](st.pop()))
+                elif val in _UNARY_OPS:
+                    st.append(_np_op(val)(st.pop()))
+                else:
+                    b = st.pop()
+                    st.append(_np_op(val)(st.pop(), b))
+        except IndexError:
+            raise ValueError("Invalid expression") from None
+
+    if len(st) != 1:
+        raise ValueError("Invalid expression")
+    # constant expressions (no x) give a scalar, stretch it over every sample
+    return np.broadcast_to(np.asarray(st[0], dtype=float), xs.shape)
+
+
+def refine(rpn, xs, ys, y_tol, max_depth=4):
+    """
+    Adds midpoints where the curve bends sharply (second difference bigger than y_tol, about one pixel)
+    or where it enters/leaves its domain. Each pass evaluates all new midpoints in one vector call.
+    """
+    for _ in range(max_depth):
+        if len(xs) < 3:
+            break
+
+        finite = np.isfinite(ys)
+        with np.errstate(invalid="ignore"):
+            bent = np.abs(ys[:-2] - 2 * ys[1:-1] + ys[2:]) > y_tol
+
+        # a bent point refines both segments around it
+        seg = finite[:-1] != finite[1:]
+        seg[:-1] |= bent
+        seg[1:] |= bent
+        idx = np.nonzero(seg)[0]
+        if idx.size == 0:
+            break
+
+        mids = (xs[idx] + xs[idx + 1]) * 0.5
+        xs = np.insert(xs, idx + 1, mids)
+        ys = np.insert(ys, idx + 1, eval_rpn_vector(rpn, mids))
+
+    return xs, ys
+
+
+# ---------------- Sample cache ----------------
+
+class _Block:
+    # samples for one zoom level on the grid x = k * dx, covering k_lo..k_hi (plus refinement points in between)
+    __slots__ = ("k_lo", "k_hi", "xs", "ys", "y_tol")
+
+    def __init__(self, k_lo, k_hi, xs, ys, y_tol):
+        self.k_lo = k_lo
+        self.k_hi = k_hi
+        self.xs = xs
+        self.ys = ys
+        self.y_tol = y_tol
+
+
+class GraphSampler:
+    """
+    Samples f(x) for the visible window.
+    Samples sit on a grid whose spacing is a power of two, one cached block per zoom level,
+    so panning only evaluates the newly exposed strip and zooming back reuses the old level.
+    """
+
+    MAX_LEVELS = 8
+
+    def __init__(self, expr: str, samples: int = 400):
+        self.rpn = compile_expression(expr, ("x",))
+        self.samples = samples
+        self._blocks = {}
+
+    def visible(self, x_min: float, x_max: float, y_tol: float):
+        level = math.floor(math.log2((x_max - x_min) / self.samples))
+        dx = 2.0 ** level
+        k_lo = math.floor(x_min / dx) - 1
+        k_hi = math.ceil(x_max / dx) + 1
+
+        block = self._blocks.get(level)
+        # zoomed in on y since this level was sampled -> refinement is too coarse now
+        if block is not None and (y_tol < block.y_tol / 2 or k_hi < block.k_lo or k_lo > block.k_hi):
+            block = None
+
+        if block is None:
+            xs, ys = self._chunk(k_lo, k_hi, dx, y_tol)
+            block = _Block(k_lo, k_hi, xs, ys, y_tol)
+            self._remember(level, block)
+        else:
+            if k_lo < block.k_lo:
+                xs, ys = self._chunk(k_lo, block.k_lo, dx, block.y_tol)
+                block.xs = np.concatenate((xs[:-1], block.xs))
+                block.ys = np.concatenate((ys[:-1], block.ys))
+                block.k_lo = k_lo
+            if k_hi > block.k_hi:
+                xs, ys = self._chunk(block.k_hi, k_hi, dx, block.y_tol)
+                block.xs = np.concatenate((block.xs, xs[1:]))
+                block.ys = np.concatenate((block.ys, ys[1:]))
+                block.k_hi = k_hi
+            self._trim(block, k_lo, k_hi, dx)
+
+        lo = np.searchsorted(block.xs, k_lo * dx)
+        hi = np.searchsorted(block.xs, k_hi * dx, side="right")
+        return block.xs[lo:hi], block.ys[lo:hi]
+
+    def _chunk(self, k_a, k_b, dx, y_tol):
+        xs = np.arange(k_a, k_b + 1, dtype=float) * dx
+        return refine(self.rpn, xs, eval_rpn_vector(self.rpn, xs), y_tol)
+
+    def _trim(self, block, k_lo, k_hi, dx):
+        # keep at most two screen widths of samples on either side of the view
+        width = k_hi - k_lo
+        if block.k_hi - block.k_lo <= 5 * width:
+            return
+        keep_lo = max(block.k_lo, k_lo - 2 * width)
+        keep_hi = min(block.k_hi, k_hi + 2 * width)
+        lo = np.searchsorted(block.xs, keep_lo * dx)
+        hi = np.searchsorted(block.xs, keep_hi * dx, side="right")
+        block.xs = block.xs[lo:hi]
+        block.ys = block.ys[lo:hi]
+        block.k_lo = keep_lo
+        block.k_hi = keep_hi
+
+    def _remember(self, level, block):
+        self._blocks[level] = block
+        while len(self._blocks) > self.MAX_LEVELS:
+            farthest = max(self._blocks, key=lambda lv: abs(lv - level))
+            del self._blocks[farthest]
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from kivy.app import App
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.graphics import Color, Mesh, Rectangle
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.label import Label
+from kivy.uix.textinput import TextInput
+from kivy.uix.widget import Widget
+
+from graph_sampler import GraphSampler
+from styles import BLACK, DARK_GRAY, ORANGE, SOFT_GRAY
+
+# ---------------- Graph widget ----------------
+
+class GraphView(Widget):
+    """
+    Draws f(x) as a single Mesh of line segments.
+    Drag to pan, pinch or mouse-wheel to zoom. Redraws are coalesced to at most one per frame.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.sampler = None
+        self.reset_view()
+        self._touches = []
+
+        with self.canvas:
+            Color(*BLACK)
+            self._bg = Rectangle(pos=self.pos, size=self.size)
+            Color(*DARK_GRAY)  # axes (dark gray)
+            self._axes = Mesh(mode="lines")
+            Color(*ORANGE)  # curve (orange, same as the operator keys)
+            self._curve = Mesh(mode="lines")
+
+        self._redraw_trigger = Clock.create_trigger(self._redraw)
+        self.bind(pos=self._redraw_trigger, size=self._redraw_trigger)
+
+    def set_expression(self, expr: str):
+        # raises ValueError for expressions the engine can't parse
+        self.sampler = GraphSampler(expr)
+        self._redraw_trigger()
+
+    def reset_view(self):
+        self.x_min, self.x_max = -10.0, 10.0
+        self.y_min, self.y_max = -10.0, 10.0
+        if hasattr(self, "_redraw_trigger"):
+            self._redraw_trigger()
+
+    def zoom(self, factor: float, cx: float | None = None, cy: float | None = None):
+        # factor < 1 zooms in; (cx, cy) is the point in graph units that stays put
+        cx = (self.x_min + self.x_max) / 2 if cx is None else cx
+        cy = (self.y_min + self.y_max) / 2 if cy is None else cy
+        self.x_min = cx + (self.x_min - cx) * factor
+        self.x_max = cx + (self.x_max - cx) * factor
+        self.y_min = cy + (self.y_min - cy) * factor
+        self.y_max = cy + (self.y_max - cy) * factor
+        self._redraw_trigger()
+
+    def _to_graph(self, px, py):
+        gx = self.x_min + (px - self.x) / self.width * (self.x_max - self.x_min)
+        gy = self.y_min + (py - self.y) / self.height * (self.y_max - self.y_min)
+        return gx, gy
+
+    # ---------- Touch: pan / zoom ----------
+    def on_touch_down(self, touch):
+        if not self.collide_point(*touch.pos):
+            return super().on_touch_down(touch)
+
+        if touch.is_mouse_scrolling:
+            factor = 0.8 if touch.button == "scrolldown" else 1.25
+            self.zoom(factor, *self._to_graph(*touch.pos))
+            return True
+
+        touch.grab(self)
+        self._touches.append(touch)
+        return True
+
+    def on_touch_move(self, touch):
+        if touch.grab_current is not self:
+            return super().on_touch_move(touch)
+
+        if len(self._touches) >= 2:
+            a, b = self._touches[:2]
+            other = b if touch is a else a
+            old = math.dist((touch.px, touch.py), other.pos)
+            new = math.dist(touch.pos, other.pos)
+            if old > 0 and new > 0:
+                mid = ((touch.x + other.x) / 2, (touch.y + other.y) / 2)
+                self.zoom(old / new, *self._to_graph(*mid))
+            return True
+
+        shift_x = touch.dx / self.width * (self.x_max - self.x_min)
+        self.x_min -= shift_x
+        self.x_max -= shift_x
+        shift_y = touch.dy / self.height * (self.y_max - self.y_min)
+        self.y_min -= shift_y
+        self.y_max -= shift_y
+        self._redraw_trigger()
+        return True
+
+    def on_touch_up(self, touch):
+        if touch.grab_current is not self:
+            return super().on_touch_up(touch)
+        touch.ungrab(self)
+        if touch in self._touches:
+            self._touches.remove(touch)
+        return True
+
+    # ---------- Drawing ----------
+    def _redraw(self, *args):
+        self._bg.pos = self.pos
+        self._bg.size = self.size
+        if self.width <= 0 or self.height <= 0:
+            return
+
+        sx = self.width / (self.x_max - self.x_min)
+        sy = self.height / (self.y_max - self.y_min)
+
+        # axes through the origin when it's on screen
+        axes = []
+        ox = self.x + (0 - self.x_min) * sx
+        oy = self.y + (0 - self.y_min) * sy
+        if self.y <= oy <= self.top:
+            axes += [self.x, oy, 0, 0, self.right, oy, 0, 0]
+        if self.x <= ox <= self.right:
+            axes += [ox, self.y, 0, 0, ox, self.top, 0, 0]
+        self._axes.vertices = axes
+        self._axes.indices = list(range(len(axes) // 4))
+
+        if self.sampler is None:
+            self._curve.vertices = []
+            self._curve.indices = []
+            return
+
+        xs, ys = self.sampler.visible(self.x_min, self.x_max, y_tol=1.0 / sy)
+        xs = xs[:65535]  # Mesh indices are 16-bit
+        ys = ys[:65535]
+
+        px = self.x + (xs - self.x_min) * sx
+        py = self.y + (ys - self.y_min) * sy
+        finite = np.isfinite(py)
+        py = np.clip(np.nan_to_num(py), self.y - self.height, self.top + self.height)
+
+        # skip segments that leave the domain or jump across an asymptote (tan at pi/2)
+        ok = finite[:-1] & finite[1:] & (np.abs(np.diff(py)) < self.height)
+        seg = np.nonzero(ok)[0]
+
+        zeros = np.zeros_like(px)
+        self._curve.vertices = np.column_stack((px, py, zeros, zeros)).ravel().tolist()
+        self._curve.indices = np.column_stack((seg, seg + 1)).ravel().tolist()
+
+
+class GraphScreen(BoxLayout):
+    """
+    Graphing mode: type f(x) using x (e.g. sin(x)*x^2), then Plot.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation="vertical", padding=14, spacing=10, **kwargs)
+
+        top = BoxLayout(orientation="horizontal", size_hint_y=None, height=56, spacing=8)
+        self.expr_input = TextInput(
+            text="sin(x)",
+            hint_text="f(x) =",
+            font_size=24,
+            multiline=False,
+        )
+        self.expr_input.bind(on_text_validate=self.plot)
+        top.add_widget(self.expr_input)
+        top.add_widget(Button(text="Plot", font_size=22, size_hint_x=None, width=80, on_press=self.plot))
+        self.add_widget(top)
+
+        self.status = Label(text="", font_size=16, size_hint_y=None, height=24)
+        self.status.color = SOFT_GRAY
+        self.add_widget(self.status)
+
+        self.graph = GraphView()
+        self.add_widget(self.graph)
+
+        controls = BoxLayout(orientation="horizontal", size_hint_y=None, height=56, spacing=8)
+        controls.add_widget(Button(text="−", font_size=28, on_press=lambda _: self.graph.zoom(1.25)))
+        controls.add_widget(Button(text="+", font_size=28, on_press=lambda _: self.graph.zoom(0.8)))
+        controls.add_widget(Button(text="Reset", font_size=22, on_press=lambda _: self.graph.reset_view()))
+        self.add_widget(controls)
+
+        self.plot()
+
+    def plot(self, *args):
+        try:
+            self.graph.set_expression(self.expr_input.text)
+            self.status.text = ""
+        except Exception:
+            self.status.text = "Error"
+
+
+class GraphApp(App):
+    def build(self):
+        Window.size = (360, 640)  # nicer default window size on desktop (ignored on Android)
+        self.title = "Android Calculator - Graph"
+        return GraphScreen()
+
+
+if __name__ == "__main__":
+    GraphApp().run()
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import operator
+import re
+from functools import lru_cache
+
+from calculator_engine import _LPAREN_TOKEN, _RPAREN_TOKEN, _check_arity, _to_rpn
+
+# ---------------- Integer operators ----------------
+# Programmer mode works on Python ints only (the calculator's engine turns every number into a float).
+# It reuses the calculator's parser with its own operator table, C-style:
+# precedence: unary - ~ > * / % > + - > << >> > & > ^ (XOR) > |
+# / and % truncate toward zero like C (-7 / 2 = -3, -7 % 2 = -1)
+
+MAX_BITS = 1 << 16  # results bigger than this (without a word size) are an error, not a frozen screen
+
+_PREC = {}
+_RIGHT_ASSOC = set()
+_PREFIX_OPS = set()
+_BINARY_OPS = {}
+_UNARY_OPS = {}
+_OP_TOKENS = {}
+_UNARY_TOKENS = {}
+
+
+def _register(symbol, prec, fn, text=None, prefix=False):
+    token = ("op", symbol)
+    _PREC[symbol] = prec
+    if prefix:
+        _RIGHT_ASSOC.add(symbol)
+        _PREFIX_OPS.add(symbol)
+        _UNARY_OPS[symbol] = fn
+        _UNARY_TOKENS[text or symbol] = token
+    else:
+        _BINARY_OPS[symbol] = fn
+        _OP_TOKENS[text or symbol] = token
+
+
+def _div(a, b):
+    if b == 0:
+        raise ZeroDivisionError("Division by zero")
+    q = abs(a) // abs(b)
+    return -q if (a < 0) != (b < 0) else q
+
+
+def _rem(a, b):
+    return a - b * _div(a, b)
+
+
+def _shift_left(a, b):
+    if b > MAX_BITS:
+        raise OverflowError("Shift too large")
+    return a << b
+
+
+_register("|", 1, operator.or_)
+_register("^", 2, operator.xor)
+_register("&", 3, operator.and_)
+_register("<<", 4, _shift_left)
+_register(">>", 4, operator.rshift)
+_register("+", 5, operator.add)
+_register("-", 5, operator.sub)
+_register("*", 6, operator.mul)
+_register("/", 6, _div)
+_register("%", 6, _rem)
+_register("u-", 7, operator.neg, text="-", prefix=True)
+_register("u+", 7, operator.pos, text="+", prefix=True)
+_register("~", 7, operator.invert, prefix=True)
+
+
+# ---------------- Base conversion ----------------
+# Hex, octal and binary go through int(s, base) / format(), which are linear-time C loops for power-of-two
+# bases. Decimal is the slow one: str(int) and int(str) are quadratic and refuse more than 4300 digits, so
+# long decimals are split in halves at cached powers of ten and only CHUNK-digit pieces are converted directly.
+
+BASE_NAMES = {16: "HEX", 10: "DEC", 8: "OCT", 2: "BIN"}
+_DIGITS = {2: "01", 8: "01234567", 10: "0123456789", 16: "0123456789abcdefABCDEF"}
+_PREFIX_BASES = {"0x": 16, "0o": 8, "0b": 2, "0d": 10}
+_FORMAT_CODES = {16: "X", 8: "o", 2: "b"}
+_GROUPS = {16: 4, 10: 3, 8: 3, 2: 4}
+_SEPARATORS = {16: " ", 10: ",", 8: " ", 2: " "}
+
+_CHUNK = 1000  # digits converted in one go
+
+
+@lru_cache(maxsize=None)
+def _pow10(digits: int) -> int:
+    return 10 ** digits
+
+
+def _split_point(digits: int) -> int:
+    # CHUNK * 2^k digits, between a quarter and a half of the total: few distinct powers, balanced halves
+    k = _CHUNK
+    while k * 4 <= digits:
+        k *= 2
+    return k
+
+
+def _from_decimal(digits: str) -> int:
+    if len(digits) <= _CHUNK:
+        return int(digits)
+    low = _split_point(len(digits))
+    return _from_decimal(digits[:-low]) * _pow10(low) + _from_decimal(digits[-low:])
+
+
+def _to_decimal(value: int) -> str:
+    # value >= 0
+    if value < _pow10(_CHUNK):
+        return str(value)
+    low = _split_point(int(value.bit_length() * 0.30103) + 1)
+    high, rest = divmod(value, _pow10(low))
+    return _to_decimal(high) + _to_decimal(rest).zfill(low)
+
+
+def parse_int(text: str, base: int = 10) -> int:
+    # 0x / 0o / 0b / 0d prefixes override the current base; _ can separate digits (0xFFFF_FFFF).
+    # In HEX, B and D are digits, so 0B1 is 0xB1 and only 0x / 0o count as prefixes there.
+    prefix = text[:2].lower()
+    digits = text
+    if prefix in _PREFIX_BASES and prefix[1] not in _DIGITS[base]:
+        base = _PREFIX_BASES[prefix]
+        digits = text[2:]
+    digits = digits.replace("_", "")
+    # strip() with the digit table leaves something behind only if there's a character that isn't a digit
+    if not digits or digits.strip(_DIGITS[base]):
+        raise ValueError(f"Not a {BASE_NAMES[base]} number: {text}")
+    return _from_decimal(digits) if base == 10 else int(digits, base)
+
+
+def format_int(value: int, base: int = 10, bits: int | None = None, group: bool = True) -> str:
+    # with a word size, negative numbers show their two's complement bits in HEX/OCT/BIN (like a real register)
+    if value < 0 and bits and base != 10:
+        value &= (1 << bits) - 1
+    sign = "-" if value < 0 else ""
+    value = abs(value)
+    digits = _to_decimal(value) if base == 10 else format(value, _FORMAT_CODES[base])
+    if not group:
+        return sign + digits
+
+    size = _GROUPS[base]
+    head = len(digits) % size or size
+    parts = [digits[:head]]
+    parts.extend(digits[i:i + size] for i in range(head, len(digits), size))
+    return sign + _SEPARATORS[base].join(parts)
+
+
+# ---------------- Integer expressions ----------------
+
+# a number is one word (digits, letters, _), prefix included; parse_int decides what it means in the current base
+_INT_LEX_RE = re.compile(r"\w+|<<|>>|\S")
+
+
+def _tokenize_int(expr: str, base: int):
+    tokens = []
+    append = tokens.append
+    after_operand = False
+
+    for text in _INT_LEX_RE.findall(expr):
+        if text[0].isalnum() or text[0] == "_":
+            append(("num", parse_int(text, base)))
+            after_operand = True
+        elif text == "(":
+            append(_LPAREN_TOKEN)
+            after_operand = False
+        elif text == ")":
+            append(_RPAREN_TOKEN)
+            after_operand = True
+        elif after_operand and text in _OP_TOKENS:
+            append(_OP_TOKENS[text])
+            after_operand = False
+        elif not after_operand and text in _UNARY_TOKENS:
+            append(_UNARY_TOKENS[text])
+        elif text in _OP_TOKENS or text in _UNARY_TOKENS:
+            raise ValueError(f"Misplaced {text}")
+        else:
+            raise ValueError(f"Invalid character: {text}")
+    return tokens
+
+
+@lru_cache(maxsize=64)
+def compile_int_expression(expr: str, base: int = 10) -> tuple:
+    rpn = tuple(_to_rpn(_tokenize_int(expr, base), _PREC, _RIGHT_ASSOC, _PREFIX_OPS))
+    _check_arity(rpn, _UNARY_OPS)
+    return rpn
+
+
+def _wrapper(bits):
+    if bits is None:
+        def check(v):
+            if v.bit_length() > MAX_BITS:
+                raise OverflowError("Result too large")
+            return v
+        return check
+
+    # keep the low `bits` bits and read them as a signed (two's complement) number
+    mask = (1 << bits) - 1
+    sign_bit = 1 << (bits - 1)
+
+    def wrap(v):
+        v &= mask
+        return v - (1 << bits) if v & sign_bit else v
+    return wrap
+
+
+def evaluate_int(expr: str, base: int = 10, bits: int | None = None) -> int:
+    """
+    Evaluates expr with integers only; numbers are read in `base` unless they have a 0x/0o/0b/0d prefix
+    (in HEX only 0x/0o, since B and D are hex digits).
+    bits=8/16/32/64 wraps every intermediate result to that word size (signed); None means unbounded.
+    """
+    wrap = _wrapper(bits)
+    st = []
+    for kind, val in compile_int_expression(expr, base):
+        if kind == "num":
+            st.append(wrap(val))
+        elif val in _UNARY_OPS:
+            st.append(wrap(_UNARY_OPS[val](st.pop())))
+        else:
+            b = st.pop()
+            st.append(wrap(_BINARY_OPS[val](st.pop(), b)))
+    return st[0]
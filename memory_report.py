@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import gc
+import importlib.util
+import os
+import tracemalloc
+from collections import Counter
+
+# ---------------- Memory report ----------------
+# python memory_report.py
+# Prints how much Python memory (tracemalloc) the engine's caches and the calculator's widget tree hold, and
+# which source lines allocated it, so a change that grows either shows up before it reaches an old phone.
+# Kivy's textures and GL buffers are allocated outside Python and are not counted.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP_FILE = os.path.join(HERE, "CMSC 495_Python-Based Android Calculator-Updated Source Code.py")
+TOP = 8
+
+
+def _measure(label, build):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = build()
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    ignore = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"))
+    stats = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+    total = sum(stat.size_diff for stat in stats)
+
+    print(f"{label}: {total / 1024:.1f} KB kept, {peak / 1024:.1f} KB peak")
+    for stat in stats[:TOP]:
+        frame = stat.traceback[0]
+        print(f"  {stat.size_diff / 1024:9.1f} KB {stat.count_diff:8d} blocks  {os.path.basename(frame.filename)}:{frame.lineno}")
+    print()
+    return kept
+
+
+def engine_workload():
+    # what a long session leaves behind: a full program cache, a full format cache and one big pasted expression
+    import calculator_engine as engine
+
+    for i in range(256):
+        engine.evaluate_expression(f"{i}*12.5-4/2+sqrt({i})")
+    for i in range(1024):
+        engine.format_result(i / 7)
+    pasted = "+".join(f"{i}.5*sin({i})" for i in range(5000))
+    engine.compile_expression(pasted)
+    return engine
+
+
+def widget_workload(module):
+    calculator = module.AndroidCalculator()
+    widgets = list(calculator.walk())
+    print(f"{len(widgets)} widgets:", ", ".join(f"{n} {name}" for name, n in Counter(type(w).__name__ for w in widgets).most_common()))
+    return calculator
+
+
+def main():
+    _measure("engine", engine_workload)
+
+    spec = importlib.util.spec_from_file_location("calculator_app", APP_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # imports Kivy; not part of the widget numbers
+    _measure("widget tree", lambda: widget_workload(module))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from kivy.app import App
+from kivy.core.window import Window
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.label import Label
+from kivy.uix.scrollview import ScrollView
+from kivy.uix.spinner import Spinner
+from kivy.uix.textinput import TextInput
+
+from integer_engine import _DIGITS, BASE_NAMES, evaluate_int, format_int
+from styles import ORANGE
+
+# ---------------- Programmer screen ----------------
+
+class ProgrammerScreen(BoxLayout):
+    """
+    Programmer mode: type (or tap) an integer expression in the chosen base; the result is shown in
+    HEX, DEC, OCT and BIN as you type. Word size wraps results like an 8/16/32/64-bit register.
+    """
+
+    WORD_SIZES = {"8-bit": 8, "16-bit": 16, "32-bit": 32, "64-bit": 64, "Any size": None}
+    DISPLAY_CHARS = 4096  # longer results show their last DISPLAY_CHARS characters (the low bits)
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation="vertical", padding=14, spacing=8, **kwargs)
+        self.value = None
+
+        top = BoxLayout(orientation="horizontal", size_hint_y=None, height=48, spacing=8)
+        self.base = Spinner(text="DEC", values=("HEX", "DEC", "OCT", "BIN"), font_size=20)
+        self.base.bind(text=self._on_base)
+        self.word = Spinner(text="64-bit", values=tuple(self.WORD_SIZES), font_size=20)
+        self.word.bind(text=self.update)
+        top.add_widget(self.base)
+        top.add_widget(self.word)
+        top.add_widget(Button(text="AC", font_size=20, on_press=self.clear))
+        top.add_widget(Button(text="⌫", font_size=20, on_press=self.backspace))
+        self.add_widget(top)
+
+        self.entry = TextInput(text="", font_size=24, multiline=False, size_hint_y=None, height=52)
+        self.entry.bind(text=self.update)
+        self.add_widget(self.entry)
+
+        results = GridLayout(cols=2, spacing=6, size_hint_y=None)
+        results.bind(minimum_height=results.setter("height"))
+        self._results = {}
+        for base, name in BASE_NAMES.items():
+            results.add_widget(Label(text=name, font_size=16, size_hint=(None, None), width=48, height=32))
+            label = Label(text="", font_size=18, halign="right", valign="top", size_hint_y=None)
+            label.bind(width=lambda inst, w: setattr(inst, "text_size", (w, None)))
+            label.bind(texture_size=lambda inst, size: setattr(inst, "height", max(size[1], 32)))
+            label.color = ORANGE
+            results.add_widget(label)
+            self._results[base] = label
+        scroll = ScrollView()
+        scroll.add_widget(results)
+        self.add_widget(scroll)
+
+        keys = [
+            "A", "B", "C", "D", "E", "F",
+            "7", "8", "9", "&", "|", "^",
+            "4", "5", "6", "<<", ">>", "~",
+            "1", "2", "3", "+", "-", "*",
+            "0", "(", ")", "/", "%", "",
+        ]
+        self.keypad = GridLayout(cols=6, spacing=6, size_hint_y=None, height=300)
+        self._digit_keys = {}
+        for key in keys:
+            btn = Button(text=key, font_size=22, on_press=self.press)
+            if key == "":
+                btn.disabled = True
+            elif key in _DIGITS[16]:
+                self._digit_keys[key] = btn
+            self.keypad.add_widget(btn)
+        self.add_widget(self.keypad)
+
+        self._on_base(self.base, self.base.text)
+
+    def _base(self):
+        return {name: base for base, name in BASE_NAMES.items()}[self.base.text]
+
+    def press(self, btn):
+        self.entry.text += btn.text
+
+    def backspace(self, *args):
+        self.entry.text = self.entry.text[:-1]
+
+    def clear(self, *args):
+        self.entry.text = ""
+
+    def _on_base(self, _, name):
+        base = self._base()
+        for key, btn in self._digit_keys.items():
+            btn.disabled = key not in _DIGITS[base]
+        # the value on screen stays the same, its digits change
+        if self.value is not None:
+            self.entry.text = format_int(self.value, base, self.WORD_SIZES[self.word.text], group=False)
+        self.update()
+
+    def update(self, *args):
+        try:
+            self.value = evaluate_int(self.entry.text, self._base(), self.WORD_SIZES[self.word.text])
+        except Exception:
+            self.value = None
+        for base, label in self._results.items():
+            if self.value is None:
+                label.text = ""
+                continue
+            text = format_int(self.value, base, self.WORD_SIZES[self.word.text])
+            label.text = text if len(text) <= self.DISPLAY_CHARS else "…" + text[-self.DISPLAY_CHARS:]
+
+
+class ProgrammerApp(App):
+    def build(self):
+        Window.size = (360, 780)  # nicer default window size on desktop (ignored on Android)
+        self.title = "Android Calculator - Programmer"
+        return ProgrammerScreen()
+
+
+if __name__ == "__main__":
+    ProgrammerApp().run()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import math
+import re
+
+import numpy as np
+
+from calculator_engine import _NUM_RE
+
+# ---------------- Running statistics ----------------
+# count, sum, mean, variance, min and max are updated in place as each value is added or removed, never
+# recomputed over the whole list: a compensated (Kahan-Neumaier) sum, the mean read from it, and Welford's
+# update for the variance. A mean kept by Welford's update itself drifts when values are taken back out
+# (reverse updates don't cancel exactly), so the variance update uses the mean from the sum as well.
+# The values themselves are not kept: only min/max and how many times each was entered. Removing the last
+# copy of the min (or max) makes it unknown (None) until Clear, since finding the next one would need them all.
+# A big paste goes through NumPy instead: the whole block is reduced at once and merged in with the
+# parallel form of Welford's update (Chan et al.), which gives the same result as adding the values one by one.
+
+# same number grammar as the calculator, plus a sign; E or e (spreadsheets export 1E+05)
+_VALUE_RE = re.compile(r"[+-]?(?:" + _NUM_RE.pattern + r")", re.VERBOSE | re.IGNORECASE)
+
+NUMPY_THRESHOLD = 10_000  # pastes with at least this many values take the NumPy path
+
+
+def parse_values(text: str):
+    # every number in text (separated by spaces, commas, new lines, ...) as strings
+    return _VALUE_RE.findall(text)
+
+
+class RunningStats:
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.count = 0
+        self.min = math.inf        # None once the last copy of the min has been removed
+        self.max = -math.inf
+        self._min_copies = 0       # how many times min / max were entered
+        self._max_copies = 0
+        self._m2 = 0.0             # sum of squared distances from the mean
+        self._sum = 0.0
+        self._compensation = 0.0   # low-order bits the running sum has lost so far
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def sum(self) -> float:
+        return self._sum + self._compensation
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        # sample variance (divides by n-1)
+        return self._m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance) if self.count > 1 else math.nan
+
+    def _add_to_sum(self, x: float):
+        total = self._sum + x
+        if abs(self._sum) >= abs(x):
+            self._compensation += (self._sum - total) + x
+        else:
+            self._compensation += (x - total) + self._sum
+        self._sum = total
+
+    def _add_extremes(self, low, high, low_copies=1, high_copies=1):
+        if self.min is not None:
+            if low < self.min:
+                self.min, self._min_copies = low, low_copies
+            elif low == self.min:
+                self._min_copies += low_copies
+        if self.max is not None:
+            if high > self.max:
+                self.max, self._max_copies = high, high_copies
+            elif high == self.max:
+                self._max_copies += high_copies
+
+    def add(self, x):
+        x = float(x)
+        if not math.isfinite(x):
+            raise ValueError("Value out of range")
+
+        mean = self.mean
+        self.count += 1
+        self._add_to_sum(x)
+        self._m2 += (x - mean) * (x - self.mean)
+        self._add_extremes(x, x)
+
+    def remove(self, x):
+        # only values that can't have been entered are caught (nothing entered, or outside min..max)
+        x = float(x)
+        if not self.count or (self.min is not None and x < self.min) or (self.max is not None and x > self.max):
+            raise ValueError("Value not in the list")
+        if self.count == 1:
+            self.clear()
+            return
+
+        mean = self.mean
+        self.count -= 1
+        self._add_to_sum(-x)
+        self._m2 = max(self._m2 - (x - mean) * (x - self.mean), 0.0)
+
+        if x == self.min:
+            self._min_copies -= 1
+            if not self._min_copies:
+                self.min = None
+        if x == self.max:
+            self._max_copies -= 1
+            if not self._max_copies:
+                self.max = None
+
+    def add_many(self, values) -> int:
+        """
+        Adds every finite value (numbers or number strings). Returns how many were added.
+        """
+        if len(values) < NUMPY_THRESHOLD:
+            added = 0
+            for v in values:
+                try:
+                    self.add(v)
+                    added += 1
+                except ValueError:
+                    pass
+            return added
+
+        block = np.asarray(values, dtype=float)
+        block = block[np.isfinite(block)]
+        n = block.size
+        if n == 0:
+            return 0
+
+        block_mean = float(block.mean())
+        block_m2 = float(np.square(block - block_mean).sum())
+        total = self.count + n
+        delta = block_mean - self.mean
+        self._m2 += block_m2 + delta * delta * self.count * n / total
+        self.count = total
+
+        as_list = block.tolist()
+        block_sum = math.fsum(as_list)
+        as_list.append(-block_sum)
+        self._add_to_sum(block_sum)
+        self._add_to_sum(math.fsum(as_list))  # what rounding block_sum to a float lost
+        low, high = float(block.min()), float(block.max())
+        self._add_extremes(low, high, int(np.count_nonzero(block == low)), int(np.count_nonzero(block == high)))
+        return n
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from kivy.app import App
+from kivy.core.window import Window
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.label import Label
+from kivy.uix.textinput import TextInput
+
+from calculator_engine import format_result
+from running_stats import RunningStats, parse_values
+from styles import ORANGE, SOFT_GRAY
+
+# ---------------- Stats screen ----------------
+
+class StatsScreen(BoxLayout):
+    """
+    Stats mode: type or paste values (separated by spaces, commas or new lines) and press Add.
+    Remove takes the typed values back out. Only running totals are kept (not the values), so a paste of a million values is fine.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation="vertical", padding=14, spacing=8, **kwargs)
+        self.stats = RunningStats()
+
+        self.values_input = TextInput(
+            hint_text="Values, e.g. 4 8 15 16 23 42", font_size=20, multiline=True, size_hint_y=None, height=120
+        )
+        self.add_widget(self.values_input)
+
+        row = BoxLayout(orientation="horizontal", size_hint_y=None, height=48, spacing=8)
+        row.add_widget(Button(text="Add", font_size=20, on_press=self.add_values))
+        row.add_widget(Button(text="Remove", font_size=20, on_press=self.remove_values))
+        row.add_widget(Button(text="Clear", font_size=20, on_press=self.clear))
+        self.add_widget(row)
+
+        self.status = Label(text="", font_size=16, size_hint_y=None, height=24)
+        self.status.color = SOFT_GRAY
+        self.add_widget(self.status)
+
+        grid = GridLayout(cols=2, spacing=6)
+        self._results = {}
+        for name in ("n", "sum", "mean", "variance", "std dev", "min", "max"):
+            grid.add_widget(Label(text=name, font_size=20, halign="left"))
+            result = Label(text="", font_size=20, halign="right")
+            result.color = ORANGE
+            grid.add_widget(result)
+            self._results[name] = result
+        self.add_widget(grid)
+
+        self._show()
+
+    def add_values(self, *args):
+        values = parse_values(self.values_input.text)
+        added = self.stats.add_many(values)
+        skipped = len(values) - added
+        self.status.text = f"Added {added}" + (f", {skipped} out of range" if skipped else "")
+        self.values_input.text = ""
+        self._show()
+
+    def remove_values(self, *args):
+        removed = missing = 0
+        for v in parse_values(self.values_input.text):
+            try:
+                self.stats.remove(v)
+                removed += 1
+            except ValueError:
+                missing += 1
+        self.status.text = f"Removed {removed}" + (f", {missing} not in the list" if missing else "")
+        if self.stats.min is None or self.stats.max is None:
+            self.status.text += " (min/max unknown until Clear)"
+        self.values_input.text = ""
+        self._show()
+
+    def clear(self, *args):
+        self.stats.clear()
+        self.status.text = ""
+        self._show()
+
+    def _show(self):
+        s = self.stats
+        numbers = {
+            "sum": s.sum,
+            "mean": s.mean,
+            "variance": s.variance,
+            "std dev": s.stdev,
+            "min": s.min,
+            "max": s.max,
+        }
+        self._results["n"].text = str(s.count)
+        for name, value in numbers.items():
+            try:
+                self._results[name].text = format_result(value) if s.count and value is not None else ""
+            except OverflowError:  # nan/inf (variance of a single value)
+                self._results[name].text = ""
+
+
+class StatsApp(App):
+    def build(self):
+        Window.size = (360, 640)  # nicer default window size on desktop (ignored on Android)
+        self.title = "Android Calculator - Stats"
+        return StatsScreen()
+
+
+if __name__ == "__main__":
+    StatsApp().run()
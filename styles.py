@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from kivy.utils import get_color_from_hex
+
+# ---------------- Shared styles ----------------
+# Every color is converted from hex once, here, and shared by all screens and widgets (instead of once per widget)
+
+BLACK = get_color_from_hex("#000000")
+WHITE = get_color_from_hex("#FFFFFF")
+SOFT_GRAY = get_color_from_hex("#8E8E93")   # status lines, row numbers
+DARK_GRAY = get_color_from_hex("#3A3A3C")   # graph axes
+ORANGE = get_color_from_hex("#FF9500")      # results, the graph curve
+
+# Colors for button types
+BUTTON_COLORS = {
+    "num": get_color_from_hex("#333333"),   # numbers (dark gray)
+    "func": get_color_from_hex("#A5A5A5"),  # AC / % / ± / ⌫ (light gray)
+    "op": ORANGE,                           # operators + equals (orange)
+}
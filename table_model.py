@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import csv
+from collections import OrderedDict
+
+from calculator_engine import _eval_rpn, compile_expression, format_result
+
+# ---------------- Table model ----------------
+# Row i is x = start + i*step (computed from i, so no drift from adding step over and over).
+# Rows are produced on demand from the compiled RPN program; only a small LRU cache of formatted rows is kept.
+
+class TableModel:
+    def __init__(self, expr: str, start: float, step: float, count: int = 1_000_000, cache_size: int = 512):
+        # raises ValueError for expressions the engine can't parse
+        self.rpn = compile_expression(expr, ("x",))
+        self.start = start
+        self.step = step
+        self.count = count
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    def x_at(self, i: int) -> float:
+        return self.start + i * self.step
+
+    def value_at(self, i: int):
+        # f(x) for row i, or None when it can't be evaluated there (1/0, sqrt(-1), ...)
+        try:
+            return float(_eval_rpn(self.rpn, {"x": self.x_at(i)}))
+        except (ValueError, ZeroDivisionError, OverflowError):
+            return None
+
+    def row(self, i: int):
+        cached = self._cache.get(i)
+        if cached is not None:
+            self._cache.move_to_end(i)
+            return cached
+
+        cached = (self._text(self.x_at(i)), self._text(self.value_at(i)))
+
+        self._cache[i] = cached
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return cached
+
+    @staticmethod
+    def _text(v):
+        # x can overflow too (start=1e308, step=1e308)
+        try:
+            return "Error" if v is None else format_result(v)
+        except OverflowError:
+            return "Error"
+
+    def rows(self, first: int = 0, last: int | None = None):
+        # formatted (x, f(x)) rows for first..last-1, produced one at a time
+        last = self.count if last is None else min(last, self.count)
+        for i in range(first, last):
+            yield self.row(i)
+
+    def export_rows(self, f, first: int = 0, last: int | None = None, chunk: int = 2000):
+        """
+        Streams rows first..last-1 straight to the file (nothing is collected in memory, the row cache is skipped).
+        A generator: it writes `chunk` rows per step and yields how many rows are written so far, so the screen
+        can run one step per frame and stay responsive.
+        """
+        last = self.count if last is None else min(last, self.count)
+        writer = csv.writer(f)
+        writer.writerow(("x", "f(x)"))
+        for block in range(first, last, chunk):
+            for i in range(block, min(block + chunk, last)):
+                y = self.value_at(i)
+                writer.writerow((repr(self.x_at(i)), "Error" if y is None else repr(y)))
+            yield min(block + chunk, last) - first
+
+    def export_csv(self, f, first: int = 0, last: int | None = None):
+        # the whole export in one go (for scripts)
+        for _ in self.export_rows(f, first, last):
+            pass
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import math
+import os
+
+from kivy.app import App
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.properties import StringProperty
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.label import Label
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.textinput import TextInput
+
+from styles import ORANGE, SOFT_GRAY
+from table_model import TableModel
+from styles import ORANGE, SOFT_GRAY
+
+# ---------------- Table widgets ----------------
+
+class TableRow(BoxLayout):
+    x_text = StringProperty("")
+    y_text = StringProperty("")
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation="horizontal", **kwargs)
+        x_label = Label(font_size=18, halign="right")
+        y_label = Label(font_size=18, halign="right")
+        for label in (x_label, y_label):
+            label.bind(size=lambda inst, _: setattr(inst, "text_size", inst.size))
+            label.valign = "middle"
+        y_label.color = ORANGE
+        self.bind(x_text=x_label.setter("text"), y_text=y_label.setter("text"))
+        self.add_widget(x_label)
+        self.add_widget(y_label)
+
+
+class TableView(RecycleView):
+    """
+    Shows a TableModel through a sliding window of WINDOW rows.
+    When the user scrolls near either end the window shifts by PAGE rows and the scroll position is
+    adjusted so the same rows stay on screen, so a million-row table only ever builds WINDOW row dicts.
+    """
+
+    ROW_HEIGHT = 40
+    WINDOW = 200
+    PAGE = 100
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.viewclass = TableRow
+        layout = RecycleBoxLayout(
+            orientation="vertical",
+            default_size=(None, self.ROW_HEIGHT),
+            default_size_hint=(1, None),
+            size_hint_y=None,
+        )
+        layout.bind(minimum_height=layout.setter("height"))
+        self.add_widget(layout)
+
+        self.model = None
+        self.offset = 0
+        self._shifting = False
+        self.bind(scroll_y=self._on_scroll)
+
+    def set_model(self, model: TableModel):
+        self.model = model
+        self.offset = 0
+        self._fill()
+        self.scroll_y = 1
+
+    def _fill(self):
+        self.data = [
+            {"x_text": x_text, "y_text": y_text}
+            for x_text, y_text in self.model.rows(self.offset, self.offset + self.WINDOW)
+        ]
+
+    def _on_scroll(self, _, scroll_y):
+        if self.model is None or self._shifting:
+            return
+
+        if scroll_y < 0.1 and self.offset + self.WINDOW < self.model.count:
+            shift = min(self.PAGE, self.model.count - self.offset - self.WINDOW)
+        elif scroll_y > 0.9 and self.offset > 0:
+            shift = -min(self.PAGE, self.offset)
+        else:
+            return
+
+        # pixels from the top of the window to the top of the viewport, before and after the shift
+        old_h = len(self.data) * self.ROW_HEIGHT
+        top_px = (1 - scroll_y) * max(old_h - self.height, 0)
+
+        self._shifting = True
+        self.offset += shift
+        self._fill()
+        new_h = len(self.data) * self.ROW_HEIGHT
+        scrollable = max(new_h - self.height, 1)
+        top_px -= shift * self.ROW_HEIGHT
+        self.scroll_y = min(max(1 - top_px / scrollable, 0), 1)
+        self._shifting = False
+
+
+class TableScreen(BoxLayout):
+    """
+    Table mode: f(x) for x = start, start+step, start+2*step, ... (rows of them).
+    CSV saves those rows to a file a chunk per frame, so a million-row export doesn't freeze the screen.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation="vertical", padding=14, spacing=8, **kwargs)
+
+        self.expr_input = self._input("x^2", "f(x) =")
+        self.start_input = self._input("0", "start")
+        self.step_input = self._input("1", "step")
+        self.count_input = self._input("1000", "rows")
+        self.count_input.input_filter = "int"
+        self.count_input.size_hint_x = 0.4
+
+        top = BoxLayout(orientation="horizontal", size_hint_y=None, height=48, spacing=8)
+        top.add_widget(self.expr_input)
+        top.add_widget(self.count_input)
+        self.add_widget(top)
+
+        row = BoxLayout(orientation="horizontal", size_hint_y=None, height=48, spacing=8)
+        row.add_widget(self.start_input)
+        row.add_widget(self.step_input)
+        row.add_widget(Button(text="Go", font_size=20, on_press=self.build_table))
+        row.add_widget(Button(text="CSV", font_size=20, on_press=self.export))
+        self.add_widget(row)
+
+        self.status = Label(text="", font_size=16, size_hint_y=None, height=24)
+        self.status.color = SOFT_GRAY
+        self.add_widget(self.status)
+
+        self.table = TableView()
+        self.add_widget(self.table)
+
+        self._export = None  # (file, steps, path) while a CSV export is running
+        self.build_table()
+
+    def _input(self, text, hint):
+        box = TextInput(text=text, hint_text=hint, font_size=20, multiline=False)
+        box.bind(on_text_validate=self.build_table)
+        return box
+
+    def build_table(self, *args):
+        try:
+            model = TableModel(
+                self.expr_input.text,
+                float(self.start_input.text),
+                float(self.step_input.text),
+                int(self.count_input.text),
+            )
+        except Exception:
+            self.status.text = "Error"
+            return
+        if model.count < 1:
+            self.status.text = "Rows must be at least 1"
+            return
+        if not (math.isfinite(model.start) and math.isfinite(model.step)):
+            self.status.text = "Start and step must be numbers"
+            return
+        self.table.set_model(model)
+        self.status.text = ""
+
+    def export(self, *args):
+        if self.table.model is None or self._export is not None:
+            return
+        path = os.path.join(App.get_running_app().user_data_dir, "table.csv")
+        try:
+            f = open(path, "w", newline="")
+        except OSError:
+            self.status.text = "Can't write table.csv"
+            return
+        self._export = (f, self.table.model.export_rows(f), path)
+        Clock.schedule_once(self._export_step)
+
+    def _export_step(self, dt):
+        f, steps, path = self._export
+        try:
+            written = next(steps)
+        except (StopIteration, OSError) as exc:  # done, or the disk is full
+            self._export = None
+            try:
+                f.close()
+            except OSError:
+                exc = None
+            self.status.text = f"Saved {path}" if isinstance(exc, StopIteration) else "Can't write table.csv"
+            return
+        self.status.text = f"Saving... {written:,} rows"
+        Clock.schedule_once(self._export_step)
+
+
+class TableApp(App):
+    def build(self):
+        Window.size = (360, 640)  # nicer default window size on desktop (ignored on Android)
+        self.title = "Android Calculator - Table"
+        return TableScreen()
+
+
+if __name__ == "__main__":
+    TableApp().run()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from calculator_engine import compile_expression, evaluate_expression  # noqa: E402
+from test_engine_vs_eval import SEED, keypad_expression  # noqa: E402
+
+# ---------------- Engine benchmark ----------------
+# python tests/bench_engine.py [--count N]
+# Times the engine against eval() on the same seeded keypad expressions as the differential test:
+#   cold  -- every expression compiled from scratch (the compile cache is cleared first)
+#   warm  -- expressions that are already compiled (the cache holds 256; what history and re-running cost)
+#   eval  -- Python's eval(), which the screens used before the engine
+
+
+def _per_expr(fn, corpus, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(corpus)
+        best = min(best, time.perf_counter() - start)
+    return best / len(corpus) * 1e6
+
+
+def _run_all(evaluate):
+    def run(corpus):
+        for expr in corpus:
+            try:
+                evaluate(expr)
+            except ZeroDivisionError:
+                pass
+    return run
+
+
+def _cold(corpus):
+    compile_expression.cache_clear()
+    _run_all(evaluate_expression)(corpus)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="engine vs eval() timing")
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(SEED)
+    corpus = [keypad_expression(rng) for _ in range(args.count)]
+    chars = sum(map(len, corpus)) / len(corpus)
+    print(f"{args.count} keypad expressions, {chars:.1f} characters on average")
+
+    cold = _per_expr(_cold, corpus, args.repeat)
+    warm = _per_expr(_run_all(evaluate_expression), corpus[:256], args.repeat * 20)  # first run fills the cache
+    builtin = _per_expr(_run_all(lambda e: eval(e, {"__builtins__": {}})), corpus, args.repeat)
+    print(f"engine, cold: {cold:7.2f} us/expr")
+    print(f"engine, warm: {warm:7.2f} us/expr")
+    print(f"eval():       {builtin:7.2f} us/expr")
+
+
+if __name__ == "__main__":
+    main()
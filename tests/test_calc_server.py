@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import calc_server  # noqa: E402
+from calc_server import CalculatorService, evaluate_one  # noqa: E402
+
+# ---------------- Evaluation service ----------------
+# Each test starts the service on a free local port and talks JSON Lines to it, like a client would.
+
+
+def _exchange(lines, workers=0):
+    # sends every line at once (pipelined), then reads one answer per line
+    async def run():
+        service = CalculatorService(workers)
+        server = await asyncio.start_server(service.handle, "127.0.0.1", 0, limit=calc_server.MAX_LINE)
+        try:
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            writer.write(b"".join(line + b"\n" for line in lines))
+            await writer.drain()
+            answers = [json.loads(await reader.readline()) for _ in lines]
+            writer.close()
+            return answers
+        finally:
+            server.close()
+            await server.wait_closed()
+            service.close()
+    return asyncio.run(run())
+
+
+def _request(**fields):
+    return json.dumps(fields).encode()
+
+
+def test_evaluate_one_matches_the_calculator():
+    assert evaluate_one("2+3*4") == {"value": 14.0, "text": "14"}
+    assert evaluate_one("1/3") == {"value": 1 / 3, "text": "0.333333333333"}
+    assert "error" in evaluate_one("1/0")
+    assert "error" in evaluate_one("2^1024*2")
+    assert "error" in evaluate_one("1+")
+
+
+def test_pipelined_answers_come_back_in_order():
+    exprs = [f"{i}*2+1" for i in range(200)]
+    answers = _exchange([_request(id=i, expr=e) for i, e in enumerate(exprs)])
+    assert [a["id"] for a in answers] == list(range(200))
+    assert [a["value"] for a in answers] == [i * 2 + 1.0 for i in range(200)]
+
+
+def test_batch_and_bad_requests():
+    answers = _exchange([
+        _request(id=1, batch=["1/0", "sqrt(9)"]),
+        b"not json",
+        b"[1, 2]",
+        _request(id=4, expr=5),
+        _request(id=5, batch=["1+1"], share="yes"),
+        _request(id=6, expr="1+1"),
+    ])
+    assert answers[0] == {"id": 1, "results": [evaluate_one("1/0"), {"value": 3.0, "text": "3"}]}
+    assert answers[1] == {"id": None, "error": "Invalid JSON"}
+    assert answers[2]["id"] is None and "error" in answers[2]
+    assert answers[3]["id"] == 4 and "error" in answers[3]
+    assert answers[4]["id"] == 5 and "error" in answers[4]
+    assert answers[5] == {"id": 6, "value": 2.0, "text": "2"}
+
+
+def test_heavy_requests_go_to_the_pool_and_keep_their_place():
+    batch = [f"{i}/7" for i in range(calc_server.HEAVY_BATCH * 2 + 3)]
+    long_expr = "+".join(["1"] * (calc_server.HEAVY_CHARS // 2 + 1))
+    answers = _exchange([
+        _request(id="big", batch=batch),
+        _request(id="small", expr="1+1"),
+        _request(id="long", expr=long_expr),
+    ], workers=1)
+    assert [a["id"] for a in answers] == ["big", "small", "long"]
+    assert answers[0]["results"] == [evaluate_one(e) for e in batch]
+    assert answers[2]["value"] == calc_server.HEAVY_CHARS // 2 + 1
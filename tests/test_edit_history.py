@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from edit_history import EditLog  # noqa: E402
+
+# ---------------- Undo / redo ----------------
+
+
+def _typed(log, text, history="", memory=0.0):
+    # one step per character, like key presses on the keypad
+    states = []
+    for i in range(1, len(text) + 1):
+        state = (text[:i], history, False, memory)
+        log.record(state)
+        states.append(state)
+    return states
+
+
+def test_undo_and_redo_walk_back_and_forth():
+    start = ("0", "", False, 0.0)
+    log = EditLog(start)
+    states = _typed(log, "12+34")
+    assert log.undo() == states[-2]
+    assert log.undo(3) == states[0]
+    assert log.undo() == start and not log.can_undo()
+    assert log.redo(5) == states[-1] and not log.can_redo()
+
+
+def test_every_step_rebuilds_across_checkpoints():
+    start = ("0", "", False, 0.0)
+    log = EditLog(start)
+    states = [start]
+    for i in range(EditLog.CHECKPOINT * 3 + 5):
+        # typing, backspace, a new entry after "=" and a memory change all show up
+        main = states[-1][0][:-1] if i % 7 == 6 else states[-1][0] + str(i % 10)
+        if i % 50 == 49:
+            main = "42"
+        state = (main, f"hist {i // 10}", i % 50 == 49, float(i // 30))
+        log.record(state)
+        states.append(state)
+    assert len(log) == len(states)
+    for position in (0, 1, EditLog.CHECKPOINT - 1, EditLog.CHECKPOINT, EditLog.CHECKPOINT + 1, len(states) - 1):
+        assert log.goto(position) == states[position]
+    assert log.goto(len(states) + 10) == states[-1]
+    assert log.goto(-3) == states[0]
+
+
+def test_recording_after_undo_drops_the_redo_steps():
+    log = EditLog(("0", "", False, 0.0))
+    _typed(log, "123")
+    log.undo(2)
+    assert log.record(("19", "", False, 0.0))
+    assert not log.can_redo()
+    assert log.undo() == ("1", "", False, 0.0)
+    assert log.redo() == ("19", "", False, 0.0)
+
+
+def test_same_state_is_not_a_step():
+    log = EditLog(("0", "", False, 0.0))
+    assert not log.record(("0", "", False, 0.0))
+    assert len(log) == 1 and not log.can_undo()
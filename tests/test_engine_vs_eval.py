@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import math
+import os
+import random
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator_engine import evaluate_expression  # noqa: E402
+
+# ---------------- Engine vs eval() ----------------
+# The screens used to run eval() on the display text; the shared engine replaced it. For everything the
+# keypad can type with + - * / and parentheses, both must give the same float (bit for bit) or both must
+# fail with the same exception. Expressions are random but seeded, so a failure always reproduces.
+
+CASES = 20_000
+SEED = 495
+
+_INT_RE = re.compile(r"(?<![\d.])\d+(?![\d.])")
+
+
+def keypad_number(rng: random.Random) -> str:
+    whole = str(rng.choice((rng.randint(0, 9), rng.randint(0, 99), rng.randint(0, 9999))))
+    kind = rng.random()
+    if kind < 0.5:
+        return whole
+    if kind < 0.9:
+        return f"{whole}.{rng.randint(0, 999)}"
+    return rng.choice((f"{whole}.", f".{rng.randint(0, 99)}"))
+
+
+def keypad_expression(rng: random.Random, depth: int = 3) -> str:
+    # operand (op operand)*, where an operand is a number, a signed operand or a parenthesized expression
+    parts = []
+    for i in range(rng.randint(1, 5)):
+        if i:
+            parts.append(rng.choice("+-*/"))
+        roll = rng.random()
+        if depth and roll < 0.2:
+            operand = f"({keypad_expression(rng, depth - 1)})"
+        else:
+            operand = keypad_number(rng)
+        if roll > 0.9:
+            operand = "-" + operand
+        parts.append(operand)
+    return "".join(parts)
+
+
+def eval_reference(expr: str):
+    # Python would do 7/2 in floats but 99999*99999*99999 in exact integers; the calculator is floats throughout
+    return eval(_INT_RE.sub(lambda m: m.group() + ".0", expr), {"__builtins__": {}})
+
+
+def outcome(fn, expr):
+    try:
+        return fn(expr)
+    except ZeroDivisionError:
+        return ZeroDivisionError
+
+
+def same(a, b) -> bool:
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a):
+        return math.isnan(b)
+    return a == b and type(a) is type(b)
+
+
+def test_keypad_expressions_match_eval():
+    rng = random.Random(SEED)
+    mismatches = []
+    for _ in range(CASES):
+        expr = keypad_expression(rng)
+        expected = outcome(eval_reference, expr)
+        got = outcome(evaluate_expression, expr)
+        if not same(got, expected):
+            mismatches.append((expr, got, expected))
+    assert not mismatches, mismatches[:10]
+
+
+def test_corpus_covers_the_interesting_cases():
+    rng = random.Random(SEED)
+    corpus = [keypad_expression(rng) for _ in range(CASES)]
+    assert any("(" in e for e in corpus)
+    assert any(re.search(r"[-+*/]-", e) for e in corpus)  # a sign right after an operator
+    assert any(outcome(evaluate_expression, e) is ZeroDivisionError for e in corpus)
+
+
+def test_reference_is_float_arithmetic():
+    assert eval_reference("99999*99999*99999") == 99999.0 ** 3
+    assert eval_reference("3.*.5+12") == 13.5
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calc_server import evaluate_many, evaluate_one  # noqa: E402
+from expression_dag import ExpressionDAG  # noqa: E402
+
+# ---------------- Expression DAG ----------------
+
+BATCH = ["1/0", "sqrt(9)", "2^1024*2", "sqrt(-1)", "(1+0.0825)^12*1000", "(1+0.0825)^12*2000", "5km+300m to mi",
+         "1+", "10 mod 3", "20C to F", "sqrt(9)"]
+
+
+def test_shared_subexpressions_are_one_node():
+    dag = ExpressionDAG()
+    a = dag.parse("(1+0.0825)^12*1000")
+    b = dag.parse("(1+0.0825)^12*2000")
+    assert a.args[0] is b.args[0]
+    assert dag.evaluate(a) * 2 == dag.evaluate(b)
+
+
+def test_batch_matches_evaluate_one_with_and_without_sharing():
+    expected = [evaluate_one(e) for e in BATCH]
+    assert evaluate_many(BATCH) == expected        # has a repeat, so it takes the DAG
+    assert evaluate_many(BATCH, share=True) == expected
+    assert evaluate_many(BATCH, share=False) == expected
+
+
+def test_variables_are_memoized_per_env():
+    dag = ExpressionDAG()
+    root = dag.parse("x*(1+0.0825)^12 + 1/(x-2)", ("x",))
+    assert dag.evaluate(root, {"x": 3.0}) == 3.0 * 1.0825 ** 12 + 1
+    results = list(dag.evaluate_batch(["x/0+1", "x+1"], {"x": 1.0}, ("x",)))
+    assert isinstance(results[0], ZeroDivisionError) and results[1] == 2.0
+
+
+def test_cached_errors_do_not_grow_their_traceback():
+    dag = ExpressionDAG()
+    root = dag.parse("1/0+2")
+    depths = []
+    for _ in range(5):
+        try:
+            dag.evaluate(root)
+        except ZeroDivisionError as exc:
+            depth, tb = 0, exc.__traceback__
+            while tb:
+                depth, tb = depth + 1, tb.tb_next
+            depths.append(depth)
+    assert len(set(depths)) == 1
+
+
+def test_table_is_bounded_by_nodes():
+    dag = ExpressionDAG(max_nodes=1000)
+    for k in range(20):
+        dag.parse("+".join(f"{i}.5*sin({i + k})" for i in range(100)))
+    assert len(dag) <= 1000
+    dag = ExpressionDAG(keep_alive=3)
+    for k in range(10):
+        dag.parse(f"{k}+1")
+    assert len(dag._roots) == 3
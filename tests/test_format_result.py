@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator_engine import DISPLAY_WIDTH, format_result  # noqa: E402
+
+# ---------------- Result formatting ----------------
+
+
+@pytest.mark.parametrize("value, text", [
+    (14.0, "14"),
+    (0.1 + 0.2, "0.3"),
+    (1 / 3, "0.333333333333"),
+    (-1 / 3, "-0.33333333333"),
+    (2 / 3 * 1e6, "666666.6666667"),
+    (0.00012345, "0.00012345"),
+    (1e20, "1e20"),
+    (1e-5, "1e-5"),
+    (123456789012345.0, "1.23456789e14"),
+    (99999999999999.9, "1e14"),
+    (-0.0, "0"),
+])
+def test_known_values(value, text):
+    assert format_result(value) == text
+
+
+@pytest.mark.parametrize("value", [float("inf"), float("-inf"), float("nan")])
+def test_inf_and_nan_raise(value):
+    with pytest.raises(OverflowError):
+        format_result(value)
+
+
+def test_always_fits_and_reads_back_when_it_can():
+    rng = random.Random(495)
+    for _ in range(5000):
+        x = rng.uniform(-1, 1) * 10 ** rng.randint(-320, 300)
+        text = format_result(x)
+        assert len(text) <= DISPLAY_WIDTH, (x, text)
+        if len(repr(x)) <= DISPLAY_WIDTH and "e" not in repr(x):
+            assert float(text) == x, (x, text)
+        else:
+            assert float(text) == pytest.approx(x, rel=1e-6), (x, text)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from integer_engine import evaluate_int, format_int, parse_int  # noqa: E402
+
+# ---------------- Programmer mode: integers and bases ----------------
+
+
+@pytest.mark.parametrize("text, base, value", [
+    ("255", 10, 255), ("ff", 16, 255), ("FF", 16, 255), ("377", 8, 255), ("1111_1111", 2, 255),
+    ("0xff", 10, 255), ("0b101", 10, 5), ("0o17", 2, 15), ("0d99", 16, 0xD99), ("0B1", 16, 0xB1),
+])
+def test_parse_int(text, base, value):
+    assert parse_int(text, base) == value
+
+
+@pytest.mark.parametrize("text, base", [("12", 2), ("8", 8), ("g", 16), ("0x", 10), ("", 10), ("1.5", 10)])
+def test_parse_int_rejects_digits_outside_the_base(text, base):
+    with pytest.raises(ValueError):
+        parse_int(text, base)
+
+
+@pytest.mark.parametrize("args, text", [
+    ((1234567,), "1,234,567"), ((0xDEADBEEF, 16), "DEAD BEEF"), ((5, 2), "101"), ((-42,), "-42"),
+    ((-1, 16, 8), "FF"), ((-1, 2, 8), "1111 1111"), ((-1, 10, 8), "-1"), ((0xDEADBEEF, 16, None, False), "DEADBEEF"),
+])
+def test_format_int(args, text):
+    assert format_int(*args) == text
+
+
+def test_long_decimals_round_trip():
+    # past the 4300-digit limit of str(int) / int(str)
+    for value in (10 ** 5000 + 7, 3 ** 20000, -(7 ** 9000)):
+        text = format_int(value, group=False)
+        assert parse_int(text.lstrip("-")) == abs(value)
+        assert int(format_int(value, 16, group=False), 16) == value
+
+
+@pytest.mark.parametrize("expr, base, bits, value", [
+    ("2+3*4&7|8", 10, None, 14),
+    ("-7/2", 10, None, -3),         # C-style: division truncates toward zero
+    ("-7%2", 10, None, -1),
+    ("ff+1", 16, None, 256),
+    ("0xff+0b1", 10, None, 256),
+    ("127+1", 10, 8, -128),         # wraps like an 8-bit register
+    ("1<<63", 10, 64, -(1 << 63)),
+    ("~0", 2, 8, -1),
+    ("1 ^ 3", 10, None, 2),         # ^ is XOR here
+])
+def test_evaluate_int(expr, base, bits, value):
+    assert evaluate_int(expr, base, bits) == value
+
+
+@pytest.mark.parametrize("expr, error", [
+    ("1/0", ZeroDivisionError), ("1<<100000", OverflowError), ("2*", ValueError), ("1+*2", ValueError),
+    ("1.5", ValueError),
+])
+def test_evaluate_int_errors(expr, error):
+    with pytest.raises(error):
+        evaluate_int(expr)
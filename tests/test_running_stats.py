@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import math
+import os
+import random
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from running_stats import NUMPY_THRESHOLD, RunningStats  # noqa: E402
+
+# ---------------- Running statistics ----------------
+# Checked against the statistics module on the same values.
+
+
+def _check(stats, values):
+    assert stats.count == len(values)
+    assert math.isclose(stats.sum, math.fsum(values), rel_tol=1e-12, abs_tol=1e-9)
+    assert math.isclose(stats.mean, statistics.fmean(values), rel_tol=1e-12, abs_tol=1e-9)
+    assert math.isclose(stats.variance, statistics.variance(values), rel_tol=1e-6, abs_tol=1e-9)
+
+
+def test_add_matches_statistics():
+    values = [4, 8, 15, 16, 23, 42]
+    stats = RunningStats()
+    for v in values:
+        stats.add(v)
+    _check(stats, values)
+    assert (stats.min, stats.max) == (4, 42)
+
+
+def test_numpy_path_matches_one_by_one():
+    rng = random.Random(38)
+    values = [rng.gauss(5, 2) for _ in range(NUMPY_THRESHOLD + 5)]
+    one, block = RunningStats(), RunningStats()
+    for v in values:
+        one.add(v)
+    assert block.add_many(values) == len(values)
+    _check(block, values)
+    assert (block.min, block.max) == (one.min, one.max) == (min(values), max(values))
+
+
+def test_removing_most_values_does_not_drift():
+    rng = random.Random(38)
+    values = [1e9 + rng.gauss(0, 1) for _ in range(20_000)]
+    stats = RunningStats()
+    stats.add_many(values)
+    for v in values[:19_990]:
+        stats.remove(v)
+    rest = values[19_990:]
+    assert stats.mean == statistics.fmean(rest)
+    assert math.isclose(stats.variance, statistics.variance(rest), rel_tol=1e-4)
+
+
+def test_min_max_copies():
+    stats = RunningStats()
+    for v in (4, 8, 4, 42):
+        stats.add(v)
+    stats.remove(4)
+    assert stats.min == 4          # one copy left
+    stats.remove(4)
+    assert stats.min is None       # unknown until clear
+    assert stats.max == 42
+    stats.add(1)
+    assert stats.min is None
+    stats.clear()
+    stats.add(7)
+    assert (stats.min, stats.max) == (7, 7)
+
+
+def test_remove_rejects_impossible_values():
+    stats = RunningStats()
+    for bad in (1, "nan"):
+        try:
+            stats.remove(bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("removed from an empty list")
+    stats.add(5)
+    stats.add(10)
+    try:
+        stats.remove(11)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("removed a value above the max")
+    stats.remove(10)
+    stats.remove(5)
+    assert stats.count == 0 and stats.min == math.inf
+
+
+def test_add_rejects_non_finite():
+    stats = RunningStats()
+    assert stats.add_many(["1", "inf", "2", "nan"]) == 2
+    assert stats.sum == 3
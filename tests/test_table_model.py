@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import csv
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from table_model import TableModel  # noqa: E402
+
+# ---------------- Table model ----------------
+
+
+def test_rows_are_computed_from_the_index():
+    model = TableModel("x^2+1/x", 0, 0.1, 1_000_000)
+    assert model.row(0) == ("0", "Error")
+    assert model.x_at(999_999) == 0.1 * 999_999  # no drift from adding step over and over
+    assert list(model.rows(3, 5)) == [model.row(3), model.row(4)]
+    assert list(model.rows(999_998)) == [model.row(999_998), model.row(999_999)]
+
+
+def test_row_cache_is_bounded():
+    model = TableModel("x", 0, 1, 10_000, cache_size=16)
+    for _ in model.rows():
+        pass
+    assert len(model._cache) == 16
+
+
+def test_overflowing_x_is_an_error_row():
+    model = TableModel("x", 1e308, 1e308, 3)
+    assert list(model.rows()) == [("1e308", "1e308"), ("Error", "Error"), ("Error", "Error")]
+
+
+def test_export_streams_a_range_in_chunks():
+    model = TableModel("2*x", 1.0, 1.0, 100)
+    f = io.StringIO()
+    progress = list(model.export_rows(f, 10, 15, chunk=2))
+    assert progress == [2, 4, 5]
+    rows = list(csv.reader(io.StringIO(f.getvalue())))
+    assert rows[0] == ["x", "f(x)"]
+    assert rows[1:] == [[repr(float(x)), repr(2.0 * x)] for x in range(11, 16)]
+
+
+def test_export_csv_writes_every_row():
+    model = TableModel("1/(x-2)", 0.0, 1.0, 5)
+    f = io.StringIO()
+    model.export_csv(f)
+    rows = list(csv.reader(io.StringIO(f.getvalue())))
+    assert len(rows) == 6 and rows[3] == ["2.0", "Error"]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator_engine import UNITS, convert, evaluate_expression  # noqa: E402
+
+# ---------------- Units ----------------
+# "to <unit>" may only change the unit of the answer, never what the expression means.
+
+EXPRESSIONS = [
+    ("20C + 5C", "K"), ("2*10C", "K"), ("-5C", "K"), ("100F", "K"), ("1ft + 1", "m"), ("5km + 300m", "m"),
+    ("3*12in - 1ft", "m"), ("1ft", "m"), ("(2+3)*4lb", "g"), ("1 gal + 2qt", "L"), ("1KiB - 24B", "B"),
+]
+
+
+@pytest.mark.parametrize("expr, base", EXPRESSIONS)
+def test_to_base_unit_keeps_the_value(expr, base):
+    assert evaluate_expression(f"{expr} to {base}") == evaluate_expression(expr)
+
+
+@pytest.mark.parametrize("expr, expected", [
+    ("1ft to in", 12.0),
+    ("1 gal to qt", 4.0),
+    ("20C to F", 68.0),
+    ("-5C to F", 23.0),
+    ("-40C to F", -40.0),
+    ("1KiB to bit", 8192.0),
+    ("0K to C", -273.15),
+])
+def test_single_reading_is_exact(expr, expected):
+    assert evaluate_expression(expr) == expected
+
+
+def test_mixed_expression_goes_through_the_base_unit():
+    assert evaluate_expression("5km + 300m") == 5300.0
+    assert math.isclose(evaluate_expression("5km + 300m to mi"), 5300 / 1609.344)
+    assert math.isclose(evaluate_expression("2*10C to C"), 2 * 283.15 - 273.15)
+
+
+@pytest.mark.parametrize("expr", ["5km + 3kg", "3 + km", "5 to m", "5km to kg", "5km to parsec"])
+def test_bad_unit_expressions_raise(expr):
+    with pytest.raises(ValueError):
+        evaluate_expression(expr)
+
+
+def test_convert_matches_typed_conversion():
+    for units in UNITS.values():
+        for a in units:
+            for b in units:
+                assert math.isclose(convert(3.5, a, b), evaluate_expression(f"3.5{a} to {b}"), rel_tol=1e-12, abs_tol=1e-9)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculator_engine import MAX_CLOSURE_DEPTH, VariableStore, compile_closure, compile_expression  # noqa: E402
+
+# ---------------- Variables and compiled closures ----------------
+
+
+def test_formula_follows_its_inputs():
+    v = VariableStore()
+    v.evaluate("b=2")
+    assert v.evaluate("a=3*b+1") == 7
+    v.evaluate("b=10")
+    assert v.get("a") == 31
+    assert v.evaluate("a+b") == 41
+
+
+def test_chain_of_dependents_recomputes_in_order():
+    v = VariableStore()
+    v.define("a", "1")
+    v.define("b", "a+1")
+    v.define("c", "b*2")
+    v.set("a", 5)
+    assert (v.get("b"), v.get("c")) == (6, 12)
+
+
+@pytest.mark.parametrize("text", ["1+", "x=", "2=3", "=5", "sin=2", "m=2", "ft=1", "C=3"])
+def test_bad_input_raises_value_error(text):
+    with pytest.raises(ValueError):
+        VariableStore().evaluate(text)
+
+
+def test_closure_matches_rpn_with_constant_folding():
+    rpn = compile_expression("x*(1+0.0825)^12 - 1/x", ("x",))
+    run = compile_closure(rpn, {"x": 0})
+    assert run([2.0]) == 2.0 * 1.0825 ** 12 - 0.5
+
+
+@pytest.mark.parametrize("terms", [MAX_CLOSURE_DEPTH - 1, MAX_CLOSURE_DEPTH + 1, 1200, 5000])
+def test_deep_expressions_do_not_hit_the_recursion_limit(terms):
+    v = VariableStore()
+    for i in range(terms):
+        v.define(f"L{i}", str(i + 1))
+    total = "+".join(f"L{i}" for i in range(terms))
+    assert v.evaluate(total) == terms * (terms + 1) / 2
+    v.define("total", total)
+    v.set("L0", 1001)
+    assert v.get("total") == terms * (terms + 1) / 2 + 1000
+
+
+def test_deep_expression_errors_still_raise():
+    v = VariableStore()
+    v.define("z", "0")
+    with pytest.raises(ZeroDivisionError):
+        v.evaluate("+".join(["1"] * 1000) + "/z")
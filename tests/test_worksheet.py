@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from worksheet_model import Worksheet  # noqa: E402
+
+# ---------------- Worksheet ----------------
+
+
+def _sheet(*lines):
+    sheet = Worksheet()
+    for text in lines:
+        sheet.append_line(text)
+    return sheet
+
+
+def test_lines_read_earlier_lines():
+    sheet = _sheet("2", "L1*3", "L1+L2")
+    assert [sheet.result_text(i) for i in range(3)] == ["2", "6", "8"]
+
+
+def test_changing_a_line_recomputes_only_downstream():
+    sheet = _sheet("2", "5", "L1*3", "L3+1")
+    changed = sheet.set_line(0, "4")
+    assert changed == [0, 2, 3]
+    assert sheet.values[3] == 13
+    assert sheet.set_line(1, "6") == [1]
+
+
+def test_errors_and_blanks():
+    sheet = _sheet("1/0", "", "L1+1", "L4", "L2+1")
+    assert sheet.result_text(0) == "Error"
+    assert sheet.result_text(1) == ""
+    assert math.isnan(sheet.values[2])
+    assert sheet.result_text(3) == "Error"  # a later line can't be read
+    assert sheet.result_text(4) == "Error"  # blank lines have no value
+
+
+def test_total_of_a_large_sheet():
+    sheet = _sheet(*(str(i + 1) for i in range(1200)))
+    sheet.append_line("+".join(f"L{i}" for i in range(1, 1201)))
+    assert sheet.values[1200] == 1200 * 1201 / 2
+    sheet.set_line(0, "1001")
+    assert sheet.values[1200] == 1200 * 1201 / 2 + 1000
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from kivy.app import App
+from kivy.core.window import Window
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.label import Label
+from kivy.uix.spinner import Spinner
+from kivy.uix.textinput import TextInput
+
+from calculator_engine import UNITS, convert, evaluate_expression, format_result
+from styles import ORANGE
+
+# ---------------- Conversion screen ----------------
+
+class ConvertScreen(BoxLayout):
+    """
+    Conversion mode: pick what to convert (length, mass, ...), type a value (or an expression like 3*12)
+    and pick its unit; the value is shown in every other unit of that kind at once.
+    Units can also be typed into any expression, e.g. 5km + 300m to mi.
+    """
+
+    ROW_HEIGHT = 40
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation="vertical", padding=14, spacing=8, **kwargs)
+
+        self.dimension = Spinner(text="length", values=tuple(UNITS), font_size=20, size_hint_y=None, height=48)
+        self.dimension.bind(text=self._on_dimension)
+        self.add_widget(self.dimension)
+
+        row = BoxLayout(orientation="horizontal", size_hint_y=None, height=48, spacing=8)
+        self.value_input = TextInput(text="1", font_size=20, multiline=False)
+        self.value_input.bind(text=self.update)
+        self.unit = Spinner(font_size=20, size_hint_x=0.4)
+        self.unit.bind(text=self.update)
+        row.add_widget(self.value_input)
+        row.add_widget(self.unit)
+        self.add_widget(row)
+
+        self.rows = GridLayout(cols=2, spacing=6, size_hint_y=None)
+        self.rows.bind(minimum_height=self.rows.setter("height"))
+        self.add_widget(self.rows)
+        self.add_widget(BoxLayout())  # keeps the rows at the top
+
+        self._results = {}
+        self._on_dimension(self.dimension, self.dimension.text)
+
+    def _on_dimension(self, _, dimension):
+        self.rows.clear_widgets()
+        self._results = {}
+        for unit in UNITS[dimension]:
+            result = Label(text="", font_size=20, halign="right", size_hint_y=None, height=self.ROW_HEIGHT)
+            result.bind(size=lambda inst, _: setattr(inst, "text_size", inst.size))
+            result.valign = "middle"
+            result.color = ORANGE
+            self.rows.add_widget(result)
+            self.rows.add_widget(Label(text=unit, font_size=20, size_hint=(0.3, None), height=self.ROW_HEIGHT))
+            self._results[unit] = result
+
+        self.unit.values = UNITS[dimension]
+        if self.unit.text == UNITS[dimension][0]:
+            self.update()
+        else:
+            self.unit.text = UNITS[dimension][0]  # triggers update
+
+    def update(self, *args):
+        try:
+            value = evaluate_expression(self.value_input.text)
+        except Exception:
+            value = None
+        for unit, label in self._results.items():
+            try:
+                label.text = "" if value is None else format_result(convert(value, self.unit.text, unit))
+            except (ValueError, OverflowError):
+                label.text = "Error"
+
+
+class ConvertApp(App):
+    def build(self):
+        Window.size = (360, 640)  # nicer default window size on desktop (ignored on Android)
+        self.title = "Android Calculator - Convert"
+        return ConvertScreen()
+
+
+if __name__ == "__main__":
+    ConvertApp().run()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+
+from kivy.app import App
+from kivy.core.window import Window
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.gridlayout import GridLayout
+from kivy.uix.label import Label
+from kivy.uix.scrollview import ScrollView
+from kivy.uix.textinput import TextInput
+
+from styles import ORANGE, SOFT_GRAY
+from worksheet_model import Worksheet
+
+# ---------------- Worksheet screen ----------------
+
+class WorksheetScreen(BoxLayout):
+    """
+    Worksheet mode: one expression per line, L1, L2, ... use earlier lines' results.
+    A line is recalculated when you press Enter or leave it, and only lines that depend on it update.
+    """
+
+    ROW_HEIGHT = 44
+
+    def __init__(self, **kwargs):
+        super().__init__(orientation="vertical", padding=14, spacing=8, **kwargs)
+        self.sheet = Worksheet()
+        self._inputs = []
+        self._results = []
+
+        self.rows = GridLayout(cols=3, spacing=6, size_hint_y=None)
+        self.rows.bind(minimum_height=self.rows.setter("height"))
+        scroll = ScrollView()
+        scroll.add_widget(self.rows)
+        self.add_widget(scroll)
+
+        self.add_widget(Button(text="+ Line", font_size=20, size_hint_y=None, height=48, on_press=self.add_line))
+
+        for _ in range(5):
+            self.add_line()
+
+    def add_line(self, *args):
+        index = len(self.sheet)
+        self.sheet.append_line()
+
+        number = Label(text=f"L{index + 1}", font_size=16, size_hint=(None, None), width=44, height=self.ROW_HEIGHT)
+        number.color = SOFT_GRAY
+        box = TextInput(font_size=20, multiline=False, size_hint_y=None, height=self.ROW_HEIGHT)
+        box.bind(on_text_validate=lambda inst: self._commit(index))
+        box.bind(focus=lambda inst, focused: None if focused else self._commit(index))
+        result = Label(text="", font_size=20, halign="right", size_hint=(None, None), width=120, height=self.ROW_HEIGHT)
+        result.bind(size=lambda inst, _: setattr(inst, "text_size", inst.size))
+        result.valign = "middle"
+        result.color = ORANGE
+
+        for widget in (number, box, result):
+            self.rows.add_widget(widget)
+        self._inputs.append(box)
+        self._results.append(result)
+
+    def _commit(self, index):
+        text = self._inputs[index].text
+        if text == self.sheet.lines[index]:
+            return
+        for i in self.sheet.set_line(index, text):
+            self._results[i].text = self.sheet.result_text(i)
+
+
+class WorksheetApp(App):
+    def build(self):
+        Window.size = (360, 640)  # nicer default window size on desktop (ignored on Android)
+        self.title = "Android Calculator - Worksheet"
+        return WorksheetScreen()
+
+
+if __name__ == "__main__":
+    WorksheetApp().run()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import heapq
+import math
+import re
+
+from calculator_engine import compile_closure, compile_expression, format_result
+
+# ---------------- Worksheet model ----------------
+# Every line is an expression; L1, L2, ... refer to the results of earlier lines (e.g. L3 = L1*L2).
+# Because a line can only read lines above it, line order is already a topological order:
+# after an edit, dirty lines are recomputed smallest line number first, each exactly once.
+
+_LINE_RE = re.compile(r"L([1-9]\d*)")
+
+
+class _LineNames:
+    # the names L1..L<count>; used as the tokenizer's variable set and as compile_closure's name -> slot map
+    __slots__ = ("count",)
+
+    def __init__(self, count: int):
+        self.count = count
+
+    def __contains__(self, name):
+        m = _LINE_RE.fullmatch(name)
+        return bool(m) and int(m.group(1)) <= self.count
+
+    def __getitem__(self, name):
+        return int(name[1:]) - 1
+
+    def __hash__(self):
+        return hash(("_LineNames", self.count))
+
+    def __eq__(self, other):
+        return isinstance(other, _LineNames) and other.count == self.count
+
+
+class Worksheet:
+    def __init__(self):
+        self.lines = []        # source text per line
+        self.values = []       # cached result per line (nan = blank or error)
+        self._programs = []    # compiled closure per line (None = blank or doesn't compile)
+        self._reads = []       # line indexes each line reads
+        self._dependents = []  # line index -> later lines that read it
+
+    def __len__(self):
+        return len(self.lines)
+
+    def append_line(self, text: str = ""):
+        self.lines.append("")
+        self.values.append(math.nan)
+        self._programs.append(None)
+        self._reads.append(())
+        self._dependents.append(set())
+        return self.set_line(len(self.lines) - 1, text)
+
+    def result_text(self, index: int) -> str:
+        if not self.lines[index].strip():
+            return ""
+        try:
+            return format_result(self.values[index])
+        except OverflowError:  # nan/inf
+            return "Error"
+
+    def set_line(self, index: int, text: str):
+        """
+        Replaces line `index` (0-based) and recomputes it plus everything downstream of it.
+        Returns the indexes of the lines whose result was recomputed.
+        """
+        for dep in self._reads[index]:
+            self._dependents[dep].discard(index)
+
+        self.lines[index] = text
+        self._programs[index] = None
+        self._reads[index] = ()
+        if text.strip():
+            names = _LineNames(index)  # only lines above this one
+            try:
+                rpn = compile_expression(text, names)
+                self._programs[index] = compile_closure(rpn, names)
+                self._reads[index] = tuple({names[val] for kind, val in rpn if kind == "var"})
+            except ValueError:
+                pass
+        for dep in self._reads[index]:
+            self._dependents[dep].add(index)
+
+        return self._recompute(index)
+
+    def _recompute(self, start: int):
+        changed = []
+        dirty = [start]
+        queued = {start}
+        while dirty:
+            i = heapq.heappop(dirty)
+            old = self.values[i]
+            program = self._programs[i]
+            try:
+                new = math.nan if program is None else float(program(self.values))
+            except (ValueError, ZeroDivisionError, OverflowError):
+                new = math.nan
+            self.values[i] = new
+            changed.append(i)
+
+            # unchanged result -> nothing below it needs to run again
+            if new == old or (new != new and old != old):
+                continue
+            for dep in self._dependents[i]:
+                if dep not in queued:
+                    queued.add(dep)
+                    heapq.heappush(dirty, dep)
+        return changed